@@ -7,27 +7,53 @@ This package provides utilities for:
 - URDF parsing for joint information
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Static-only imports so pyright and IDEs resolve the public names;
+    # at runtime they are served lazily by __getattr__ below.
+    from .hand import HandType
+    from .robot_info import RobotInfo
+    from .urdf_utils import get_joint_names, get_movable_joint_names, parse_urdf
+    from .validators import (
+        ComponentValidationError,
+        has_all_components,
+        has_component,
+        validate_component,
+        validate_components,
+    )
+
 __version__ = "0.1.0"
 
-# Main interface
-from .hand import HandType
-from .robot_info import RobotInfo
-
-# URDF utilities
-from .urdf_utils import (
-    get_joint_names,
-    get_movable_joint_names,
-    parse_urdf,
-)
-
-# Component validation
-from .validators import (
-    ComponentValidationError,
-    has_all_components,
-    has_component,
-    validate_component,
-    validate_components,
-)
+# Public names are imported lazily (PEP 562) so that `import dexbot_utils`
+# does not pay for numpy, the URDF parser, or the robot config registry
+# until the corresponding attribute is first accessed.
+_LAZY_IMPORTS = {
+    # Main interface
+    "RobotInfo": ".robot_info",
+    "HandType": ".hand",
+    # URDF utilities
+    "parse_urdf": ".urdf_utils",
+    "get_joint_names": ".urdf_utils",
+    "get_movable_joint_names": ".urdf_utils",
+    # Component validation
+    "ComponentValidationError": ".validators",
+    "has_all_components": ".validators",
+    "has_component": ".validators",
+    "validate_component": ".validators",
+    "validate_components": ".validators",
+}
+
+
+def __getattr__(name: str):
+    """Lazily import public names on first attribute access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, name)
+
 
 __all__ = [
     # Version
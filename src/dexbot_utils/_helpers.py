@@ -1,49 +1,79 @@
 """Internal helper functions for robot configuration."""
 
 from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
 
 
 @lru_cache(maxsize=None)
-def build_robot_type_abbreviation_mapping() -> dict[str, str]:
-    """Build robot type abbreviation mapping from registered configurations.
+def build_robot_type_mappings() -> SimpleNamespace:
+    """Build both robot type mapping directions in a single registry pass.
 
-    Scans all registered robot configurations and builds a mapping of abbreviations
-    to robot types (e.g., "vg" -> "vega").
+    Scans all registered robot configurations once and builds frozen
+    mappings in both directions: abbreviation to robot type ("vg" ->
+    "vega") and robot type to abbreviation ("vega" -> "vg").
 
     Note: vega_1u (upper body) uses "vg" abbreviation with "u" suffix in robot name
     (e.g., "dm/vg0123456789-1u" for vega upper body).
 
     Returns:
-        Dictionary mapping abbreviations to robot types.
-
-    Example:
-        >>> mapping = build_robot_type_abbreviation_mapping()
-        >>> print(mapping)
-        {'vg': 'vega'}
+        Namespace with read-only ``abbr_to_type`` and ``type_to_abbr``
+        mappings.
     """
     from .configs import ConfigRegistry
 
-    mapping = {}
+    abbr_to_type: dict[str, str] = {}
+    type_to_abbr: dict[str, str] = {}
 
-    # Get all registered variants
+    # Get all registered variants; prototypes are read-only shared instances,
+    # which avoids copying every config just to read two attributes.
     for variant in ConfigRegistry.list_variants():
-        config = ConfigRegistry.get(variant)
+        config = ConfigRegistry._get_prototype(variant)
 
         # Get abbreviation and robot_model from config
         abbr = config.abbr
         robot_model = config.robot_model
 
-        # Extract robot type from robot_model (e.g., "vega_1" -> "vega")
-        # Split on '_' and take everything except the last part (version)
-        parts = robot_model.rsplit("_", 1)
-        robot_type = parts[0] if len(parts) > 1 else robot_model
+        # Extract robot type from robot_model (e.g., "vega_1" -> "vega");
+        # rpartition returns a tuple, avoiding rsplit's list allocation
+        head, sep, _ = robot_model.rpartition("_")
+        robot_type = head if sep else robot_model
+
+        # First registration of an abbreviation wins
+        if abbr not in abbr_to_type:
+            abbr_to_type[abbr] = robot_type
+            type_to_abbr[robot_type] = abbr
+
+    return SimpleNamespace(
+        abbr_to_type=MappingProxyType(abbr_to_type),
+        type_to_abbr=MappingProxyType(type_to_abbr),
+    )
 
-        # Add to mapping if not already present
-        if abbr not in mapping:
-            mapping[abbr] = robot_type
 
-    return mapping
+@lru_cache(maxsize=None)
+def build_robot_type_abbreviation_mapping() -> dict[str, str]:
+    """Build robot type abbreviation mapping from registered configurations.
 
+    Convenience wrapper around :func:`build_robot_type_mappings` returning
+    just the abbreviation-to-type direction as a plain dict.
 
-# Build once at module load
-ROBOT_TYPE_ABB_MAPPING = build_robot_type_abbreviation_mapping()
+    Returns:
+        Dictionary mapping abbreviations to robot types.
+
+    Example:
+        >>> mapping = build_robot_type_abbreviation_mapping()
+        >>> print(mapping)
+        {'vg': 'vega'}
+    """
+    return dict(build_robot_type_mappings().abbr_to_type)
+
+
+def __getattr__(name: str):
+    """Lazily build the abbreviation mapping on first attribute access.
+
+    Building the mapping instantiates every registered robot variant, so
+    it is deferred until actually needed (PEP 562); the lru_cache on the
+    builder keeps it a one-shot cost.
+    """
+    if name == "ROBOT_TYPE_ABB_MAPPING":
+        return build_robot_type_abbreviation_mapping()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,35 @@
+from types import MappingProxyType
+
 from loguru import logger
 
 from .configs import BaseRobotConfig
 from .configs.components.vega_1.hand import (
     DexDGripperConfig,
-    DexSGripperConfig,
     F5D6HandV1Config,
     F5D6HandV2Config,
 )
 from .configs.components.vega_1.misc import EStopConfig
 from .hand import HandType
 
+# Frozen HandType -> config-class mapping for constructing overrides; the
+# forward direction reads the hand_type class attribute on the component.
+_HAND_TYPE_REVERSE_MAPPING = MappingProxyType(
+    {
+        HandType.DexGripper: DexDGripperConfig,
+        HandType.HandF5D6_V1: F5D6HandV1Config,
+        HandType.HandF5D6_V2: F5D6HandV2Config,
+    }
+)
+
+# side -> (arm_key, hand_key), precomputed so the per-call loop does not
+# reformat the same f-strings.
+_SIDE_KEYS = MappingProxyType(
+    {
+        "left": ("left_arm", "left_hand"),
+        "right": ("right_arm", "right_hand"),
+    }
+)
+
 
 def runtime_override_robot_config(
     config: BaseRobotConfig,
@@ -48,69 +68,71 @@ def runtime_override_robot_config(
 
     """
 
+    # Fast path: nothing to do when no overrides were requested, which is
+    # the common production invocation.
+    if not (disable_estop_checking or disable_heartbeat or hand_types):
+        return
+
+    components = config.components
+
     if disable_estop_checking:
-        estop = config.components.get("estop")
+        estop = components.get("estop")
         if isinstance(estop, EStopConfig):
             estop.monitoring = False
             logger.warning("EStop monitoring is disabled via environment variable")
 
     if disable_heartbeat:
-        if "heartbeat" in config.components:
-            config.components["heartbeat"].enabled = False
+        heartbeat = components.get("heartbeat")
+        if heartbeat is not None:
+            heartbeat.enabled = False
             logger.warning("Heartbeat is disabled via environment variable")
 
     # Handling hand types
-    hand_type_mapping = {
-        DexSGripperConfig: HandType.DexGripper,
-        DexDGripperConfig: HandType.DexGripper,
-        F5D6HandV1Config: HandType.HandF5D6_V1,
-        F5D6HandV2Config: HandType.HandF5D6_V2,
-    }
-    hand_type_reverse_mapping = {
-        HandType.DexGripper: DexDGripperConfig,
-        HandType.HandF5D6_V1: F5D6HandV1Config,
-        HandType.HandF5D6_V2: F5D6HandV2Config,
-    }
-    for side in ("left", "right"):
-        if side in hand_types:
-            hand_type = hand_types[side]
-            if f"{side}_arm" in config.components:
-                arm = config.components[f"{side}_arm"]
-                # EE pass-through is disabled when hand type is specified
-                if hand_type != HandType.UNKNOWN and hasattr(
-                    arm, "enable_ee_pass_through"
-                ):
-                    arm.enable_ee_pass_through = False  # type: ignore[attr-defined]
-
-            hand_key = f"{side}_hand"
-            if hand_key in config.components:
-                if hand_type == HandType.UNKNOWN:
-                    config.components[hand_key].enabled = False
-                    logger.warning(
-                        f"Disabling {side}_hand: can not detect known end-effector from robot-controller."
-                    )
-                else:
-                    desired_hand_type = hand_type_mapping[
-                        type(config.components[hand_key])
-                    ]
-                    if desired_hand_type != hand_type:
-                        if enable_hand_type_override:
-                            override_hand_cfg = hand_type_reverse_mapping[hand_type](
-                                side=side
-                            )
-                            config.components[hand_key] = override_hand_cfg
-                            logger.warning(
-                                f"Override {side}_hand config to {override_hand_cfg} based on detected hand type {hand_type}"
-                            )
-                        else:
-                            logger.warning(
-                                f"Detected {side}_hand type is {hand_type}, but the input config is {desired_hand_type}."
-                            )
+    for side, hand_type in hand_types.items():
+        side_keys = _SIDE_KEYS.get(side)
+        if side_keys is None:
+            continue
+        arm_key, hand_key = side_keys
+
+        arm = components.get(arm_key)
+        if arm is not None and hand_type != HandType.UNKNOWN:
+            # EE pass-through is disabled when hand type is specified;
+            # EAFP instead of hasattr keeps the common path cheap.
+            try:
+                arm.enable_ee_pass_through = False  # type: ignore[attr-defined]
+            except AttributeError:
+                pass
+
+        hand_comp = components.get(hand_key)
+        if hand_comp is not None:
+            if hand_type == HandType.UNKNOWN:
+                hand_comp.enabled = False
+                logger.warning(
+                    f"Disabling {side}_hand: can not detect known end-effector from robot-controller."
+                )
             else:
-                # Hand not in config — inject if a known type was detected
-                if hand_type != HandType.UNKNOWN:
-                    new_hand_cfg = hand_type_reverse_mapping[hand_type](side=side)
-                    config.components[hand_key] = new_hand_cfg
-                    logger.warning(
-                        f"Auto-adding {side}_hand config ({hand_type}) based on runtime detection"
-                    )
+                # Hand configs carry a hand_type ClassVar; a foreign
+                # component under a hand key reads as None and is treated
+                # as a mismatch.
+                desired_hand_type = getattr(hand_comp, "hand_type", None)
+                if desired_hand_type != hand_type:
+                    if enable_hand_type_override:
+                        override_hand_cfg = _HAND_TYPE_REVERSE_MAPPING[hand_type](
+                            side=side
+                        )
+                        components[hand_key] = override_hand_cfg
+                        logger.warning(
+                            f"Override {side}_hand config to {override_hand_cfg} based on detected hand type {hand_type}"
+                        )
+                    else:
+                        logger.warning(
+                            f"Detected {side}_hand type is {hand_type}, but the input config is {desired_hand_type}."
+                        )
+        else:
+            # Hand not in config — inject if a known type was detected
+            if hand_type != HandType.UNKNOWN:
+                new_hand_cfg = _HAND_TYPE_REVERSE_MAPPING[hand_type](side=side)
+                components[hand_key] = new_hand_cfg
+                logger.warning(
+                    f"Auto-adding {side}_hand config ({hand_type}) based on runtime detection"
+                )
@@ -29,9 +29,10 @@ def config_list() -> None:
     """List all available robot configuration variants."""
     variants = get_available_variants()
 
-    typer.echo(f"Available robot configurations: {len(variants)}")
-    for variant in sorted(variants):
-        typer.echo(f"  - {variant}")
+    # Emit a single write instead of one echo (and syscall) per line
+    lines = [f"Available robot configurations: {len(variants)}"]
+    lines.extend(f"  - {variant}" for variant in sorted(variants))
+    typer.echo("\n".join(lines))
 
 
 @cfg_app.command("show")
@@ -60,33 +61,39 @@ def config_show(
     try:
         robot_config = get_robot_config(variant)
 
-        typer.echo(f"Robot Configuration: {variant}")
-        typer.echo("=" * 70)
-        typer.echo(f"Robot Model: {robot_config.robot_model}")
-        typer.echo(f"Abbreviation: {robot_config.abbr}")
-        typer.echo(f"URDF Path: {robot_config.urdf_path}")
+        # Accumulate all output and emit it as one write; per-line echo
+        # calls dominate wall time when scripting over every variant
+        lines = [
+            f"Robot Configuration: {variant}",
+            "=" * 70,
+            f"Robot Model: {robot_config.robot_model}",
+            f"Abbreviation: {robot_config.abbr}",
+            f"URDF Path: {robot_config.urdf_path}",
+        ]
 
         # List components
-        typer.echo(f"\nComponents ({len(robot_config.components)}):")
-        for comp_name in sorted(robot_config.components.keys()):
-            comp = robot_config.components[comp_name]
-            comp_type = type(comp).__name__
-            typer.echo(f"  - {comp_name}: {comp_type}")
+        components = robot_config.components
+        lines.append(f"\nComponents ({len(components)}):")
+        for comp_name in sorted(components):
+            comp_type = type(components[comp_name]).__name__
+            lines.append(f"  - {comp_name}: {comp_type}")
 
         # List sensors
-        if hasattr(robot_config, "sensors") and robot_config.sensors:
-            typer.echo(f"\nSensors ({len(robot_config.sensors)}):")
-            for sensor_name in sorted(robot_config.sensors.keys()):
-                sensor = robot_config.sensors[sensor_name]
-                sensor_type = type(sensor).__name__
-                typer.echo(f"  - {sensor_name}: {sensor_type}")
+        sensors = getattr(robot_config, "sensors", None)
+        if sensors:
+            lines.append(f"\nSensors ({len(sensors)}):")
+            for sensor_name in sorted(sensors):
+                sensor_type = type(sensors[sensor_name]).__name__
+                lines.append(f"  - {sensor_name}: {sensor_type}")
 
         # List queryables
-        if hasattr(robot_config, "querables") and robot_config.querables:
-            typer.echo(f"\nQueryables ({len(robot_config.querables)}):")
-            for query_name in sorted(robot_config.querables.keys()):
-                query_path = robot_config.querables[query_name]
-                typer.echo(f"  - {query_name}: {query_path}")
+        querables = getattr(robot_config, "querables", None)
+        if querables:
+            lines.append(f"\nQueryables ({len(querables)}):")
+            for query_name in sorted(querables):
+                lines.append(f"  - {query_name}: {querables[query_name]}")
+
+        typer.echo("\n".join(lines))
 
     except ValueError as e:
         typer.echo(f"Error: {e}", err=True)
@@ -1,5 +1,15 @@
 """Robot configuration system using dataclasses."""
 
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Static-only imports so pyright and IDEs resolve the config classes;
+    # at runtime they are served lazily by __getattr__ below.
+    from .robots.vega_1 import Vega1Config, Vega1DGripperConfig, Vega1F5D6Config
+    from .robots.vega_1p import Vega1pConfig, Vega1pDGripperConfig, Vega1pF5D6Config
+    from .robots.vega_1u import Vega1UConfig, Vega1UDGripperConfig, Vega1UF5D6Config
+
 from .components import BaseComponentConfig
 from .registry import (
     ConfigRegistry,
@@ -8,9 +18,31 @@ from .registry import (
     register_variant,
 )
 from .robots.base import BaseRobotConfig
-from .robots.vega_1 import Vega1Config, Vega1DGripperConfig, Vega1F5D6Config
-from .robots.vega_1p import Vega1pConfig, Vega1pDGripperConfig, Vega1pF5D6Config
-from .robots.vega_1u import Vega1UConfig, Vega1UDGripperConfig, Vega1UF5D6Config
+
+# Robot config classes are imported lazily (PEP 562) so that importing this
+# package does not pull in every robot family and its component configs.
+# The registry loads the variant modules itself when a variant is requested.
+_LAZY_CONFIGS = {
+    "Vega1Config": ".robots.vega_1",
+    "Vega1DGripperConfig": ".robots.vega_1",
+    "Vega1F5D6Config": ".robots.vega_1",
+    "Vega1pConfig": ".robots.vega_1p",
+    "Vega1pDGripperConfig": ".robots.vega_1p",
+    "Vega1pF5D6Config": ".robots.vega_1p",
+    "Vega1UConfig": ".robots.vega_1u",
+    "Vega1UDGripperConfig": ".robots.vega_1u",
+    "Vega1UF5D6Config": ".robots.vega_1u",
+}
+
+
+def __getattr__(name: str):
+    """Lazily import robot config classes on first attribute access."""
+    module_name = _LAZY_CONFIGS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, name)
+
 
 __all__ = [
     "ConfigRegistry",
@@ -1,10 +1,11 @@
 """Base component configuration classes."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseComponentConfig:
     """Base configuration for a generic robot component.
 
@@ -21,16 +22,20 @@ class BaseComponentConfig:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseJointComponentConfig(BaseComponentConfig, ABC):
     """Base configuration for a robot component with joints.
 
     Subclasses must implement the `joints` property to return
-    the list of joint names for the component.
+    the joint names for the component.
     """
 
     @property
     @abstractmethod
-    def joints(self) -> list[str]:
-        """List of joint names for the component."""
+    def joints(self) -> Sequence[str]:
+        """Joint names for the component.
+
+        Subclasses return a list or tuple; callers should treat the
+        value as read-only.
+        """
         ...
@@ -15,7 +15,7 @@ from dataclasses import dataclass
 from ...base import BaseComponentConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraConfig(BaseComponentConfig):
     """Configuration for camera sensor.
 
@@ -10,13 +10,13 @@
 
 """Configuration for ZED camera sensor."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ...base import BaseComponentConfig
 from .camera import CameraConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class ZedXCameraConfig(BaseComponentConfig):
     """Configuration for ZED stereo camera sensor.
 
@@ -39,37 +39,45 @@ class ZedXCameraConfig(BaseComponentConfig):
     enable_rgb: bool = True
     enable_depth: bool = True
 
+    # Stream topic prefix, formatted once at construction instead of on
+    # every property access. The CameraConfig itself is still built per
+    # access because `enabled` may be toggled after construction.
+    _topic_prefix: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        self._topic_prefix = f"sensors/{self.name}"
+
     @property
     def left_rgb(self) -> CameraConfig:
         return CameraConfig(
-            enabled=self.enabled & self.enable_rgb,
+            enabled=self.enabled and self.enable_rgb,
             name="left_rgb",
             transport=self.transport,
-            topic=f"sensors/{self.name}/left_rgb",
-            rtc_channel=f"sensors/{self.name}/left_rgb_rtc",
+            topic=f"{self._topic_prefix}/left_rgb",
+            rtc_channel=f"{self._topic_prefix}/left_rgb_rtc",
         )
 
     @property
     def right_rgb(self) -> CameraConfig:
         return CameraConfig(
-            enabled=self.enabled & self.enable_rgb,
+            enabled=self.enabled and self.enable_rgb,
             name="right_rgb",
             transport=self.transport,
-            topic=f"sensors/{self.name}/right_rgb",
-            rtc_channel=f"sensors/{self.name}/right_rgb_rtc",
+            topic=f"{self._topic_prefix}/right_rgb",
+            rtc_channel=f"{self._topic_prefix}/right_rgb_rtc",
         )
 
     @property
     def depth(self) -> CameraConfig:
         return CameraConfig(
-            enabled=self.enabled & self.enable_depth,
+            enabled=self.enabled and self.enable_depth,
             name="depth",
             transport=self.transport,
-            topic=f"sensors/{self.name}/depth",
+            topic=f"{self._topic_prefix}/depth",
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ZedXOneCameraConfig(BaseComponentConfig):
     """Configuration for ZED stereo camera sensor.
 
@@ -91,12 +99,20 @@ class ZedXOneCameraConfig(BaseComponentConfig):
     transport: str = "zenoh"
     side: str = "left"
 
+    # Formatted once at construction; see ZedXCameraConfig above.
+    _rgb_topic: str = field(init=False, repr=False, compare=False, default="")
+    _rgb_rtc_channel: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        self._rgb_topic = f"sensors/{self.side}_{self.name}/rgb"
+        self._rgb_rtc_channel = f"sensors/{self.name}/rgb_rtc"
+
     @property
     def rgb(self) -> CameraConfig:
         return CameraConfig(
             enabled=self.enabled,
             name="rgb",
             transport=self.transport,
-            topic=f"sensors/{self.side}_{self.name}/rgb",
-            rtc_channel=f"sensors/{self.name}/rgb_rtc",
+            topic=self._rgb_topic,
+            rtc_channel=self._rgb_rtc_channel,
         )
@@ -13,7 +13,7 @@ from dataclasses import dataclass
 from ...base import BaseComponentConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class ChassisIMUConfig(BaseComponentConfig):
     enabled: bool = False
     topic: str = "state/chassis_imu"
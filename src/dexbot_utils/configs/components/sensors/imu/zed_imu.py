@@ -13,7 +13,7 @@ from dataclasses import dataclass
 from ...base import BaseComponentConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class ZedIMUConfig(BaseComponentConfig):
     enabled: bool = False
     topic: str = "sensors/head_camera/imu"
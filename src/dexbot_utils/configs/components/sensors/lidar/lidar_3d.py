@@ -13,7 +13,7 @@ from dataclasses import dataclass
 from ...base import BaseComponentConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class Lidar3DConfig(BaseComponentConfig):
     """Configuration for 3D LIDAR point cloud sensor."""
 
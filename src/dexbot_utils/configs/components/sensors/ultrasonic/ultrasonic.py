@@ -9,12 +9,14 @@
 #    For commercial licensing terms, contact: contact@dexmate.ai
 
 from dataclasses import dataclass
+from typing import ClassVar
 
 from ...base import BaseComponentConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class UltraSonicConfig(BaseComponentConfig):
     enabled: bool = False
-    topic: str = "state/ultrasonic"
+    # Fixed topic; a class constant avoids a per-instance field
+    topic: ClassVar[str] = "state/ultrasonic"
     name: str = "ultrasonic"
@@ -1,10 +1,32 @@
 """Arm component configuration."""
 
 from dataclasses import dataclass
+from functools import cached_property
+from types import SimpleNamespace
 
-from ..base import BaseJointComponentConfig
+import numpy as np
 
+from ..base import BaseJointComponentConfig
 
+# Populated at module bottom once the specialized subclasses exist.
+_ARM_CONFIG_BY_SIDE: dict[str, type["Vega1ArmConfig"]] = {}
+
+# Left-side poses as a single (5, 7) array; the right side mirrors joints
+# 1-3 and 5-7, so it is a vectorized multiply instead of a Python loop.
+_POSE_KEYS = ("folded", "folded_closed_hand", "L_shape", "lift_up", "zero")
+_LEFT_POSES = np.array(
+    [
+        [1.57079, 0.0, 0, -3.1, 0, 0, -0.69813],
+        [1.57079, 0.0, 0, -3.1, 0, 0, -0.9],
+        [0.064, 0.3, 0.0, -1.556, 1.271, 0.0, 0.0],
+        [0.064, 0.3, 0.0, -2.756, 1.271, 0.0, 0.0],
+        [-1.57079, 0.0, 0, 0.0, 0, 0, 0.0],
+    ]
+)
+_SIGN = np.array([-1, -1, -1, 1, -1, -1, -1])
+
+
+# Not slotted: cached_property below needs the instance __dict__.
 @dataclass
 class Vega1ArmConfig(BaseJointComponentConfig):
     """Configuration for Vega robot arm component.
@@ -34,8 +56,17 @@ class Vega1ArmConfig(BaseJointComponentConfig):
     default_control_hz: int = 100
     enable_ee_pass_through: bool = True
 
-    @property
-    def joints(self) -> list[str]:
+    def __new__(cls, *args, **kwargs):
+        # Dispatch to the per-side specialized subclass so that the derived
+        # values below are plain class attributes instead of per-instance
+        # cached properties. Explicit subclass construction is unaffected.
+        if cls is Vega1ArmConfig and _ARM_CONFIG_BY_SIDE:
+            side = kwargs.get("side", args[1] if len(args) > 1 else "left")
+            cls = _ARM_CONFIG_BY_SIDE.get(side, cls)
+        return object.__new__(cls)
+
+    @cached_property
+    def _joints_cached(self) -> list[str]:
         joint_prefix = "L" if self.side == "left" else "R"
         joint_suffixes = [
             "arm_j1",
@@ -49,59 +80,92 @@ class Vega1ArmConfig(BaseJointComponentConfig):
         return [f"{joint_prefix}_{suffix}" for suffix in joint_suffixes]
 
     @property
+    def joints(self) -> list[str]:
+        return self._joints_cached
+
+    @cached_property
     def pose_pool(self) -> dict[str, list[float]]:
-        pool = {
-            "folded": [1.57079, 0.0, 0, -3.1, 0, 0, -0.69813],
-            "folded_closed_hand": [1.57079, 0.0, 0, -3.1, 0, 0, -0.9],
-            "L_shape": [0.064, 0.3, 0.0, -1.556, 1.271, 0.0, 0.0],
-            "lift_up": [0.064, 0.3, 0.0, -2.756, 1.271, 0.0, 0.0],
-            "zero": [-1.57079, 0.0, 0, 0.0, 0, 0, 0.0],
-        }
-        if self.side == "right":
-            for k, v in pool.items():
-                pool[k] = [-v[0], -v[1], -v[2], v[3], -v[4], -v[5], -v[6]]
-        return pool
+        poses = _LEFT_POSES if self.side == "left" else _LEFT_POSES * _SIGN
+        return {key: row.tolist() for key, row in zip(_POSE_KEYS, poses)}
 
-    @property
+    @cached_property
     def state_sub_topic(self) -> str:
         return f"state/arm/{self.side}"
 
-    @property
+    @cached_property
     def wrench_sub_topic(self) -> str:
         return f"state/wrench/{self.side}"
 
-    @property
+    @cached_property
     def wrist_button_sub_topic(self) -> str:
         return f"state/wrist_button/{self.side}"
 
-    @property
+    @cached_property
     def control_pub_topic(self) -> str:
         return f"control/arm/{self.side}"
 
-    @property
+    @cached_property
     def set_mode_query(self) -> str:
         return f"mode/arm/{self.side}"
 
-    @property
+    @cached_property
     def pid_query(self) -> str:
         return f"system/arm_pid/{self.side}"
 
-    @property
+    @cached_property
     def brake_query(self) -> str:
         return f"system/arm_brake/{self.side}"
 
-    @property
+    @cached_property
     def ee_baud_rate_query(self) -> str:
         return f"system/ee_baud_rate/{self.side}"
 
-    @property
+    @cached_property
     def force_torque_sensor_query(self) -> str:
         return f"mode/force_torque_sensor/{self.side}"
 
-    @property
+    @cached_property
     def ee_pass_through_pub_topic(self) -> str:
         return f"control/ee_pass_through/{self.side}"
 
-    @property
+    @cached_property
     def ee_pass_through_state_sub_topic(self) -> str:
         return f"state/ee_pass_through/{self.side}"
+
+
+# Derived values that are mutable (lists/dicts). These must stay
+# per-instance cached properties: baking them as class attributes would
+# share one object across every config copy, so a caller mutating e.g.
+# pose_pool on one copy would leak into all others.
+_MUTABLE_DERIVED = frozenset({"_joints_cached", "pose_pool"})
+
+
+def _make_arm_config(side: str) -> type[Vega1ArmConfig]:
+    """Build a per-side arm config subclass with derived values baked in.
+
+    Evaluates the immutable cached properties of Vega1ArmConfig once for
+    the given side and stores the results as plain class attributes, so
+    instance attribute access is a single lookup with no string
+    formatting. Mutable derived values (joints, pose_pool) are left as
+    cached properties so every instance owns its own copy.
+
+    Args:
+        side: Arm side ("left" or "right").
+
+    Returns:
+        Specialized Vega1ArmConfig subclass for the side.
+    """
+    prototype = SimpleNamespace(side=side)
+    baked = {
+        name: prop.func(prototype)
+        for name, prop in vars(Vega1ArmConfig).items()
+        if isinstance(prop, cached_property) and name not in _MUTABLE_DERIVED
+    }
+    baked["__module__"] = __name__
+    return type(f"Vega1Arm{side.title()}Config", (Vega1ArmConfig,), baked)
+
+
+Vega1ArmLeftConfig = _make_arm_config("left")
+Vega1ArmRightConfig = _make_arm_config("right")
+
+_ARM_CONFIG_BY_SIDE.update({"left": Vega1ArmLeftConfig, "right": Vega1ArmRightConfig})
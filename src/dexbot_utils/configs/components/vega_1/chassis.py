@@ -1,11 +1,12 @@
 """Chassis component configuration."""
 
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from ..base import BaseJointComponentConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class Vega1ChassisConfig(BaseJointComponentConfig):
     """Configuration for Vega robot chassis/mobile base component.
 
@@ -36,10 +37,12 @@ class Vega1ChassisConfig(BaseJointComponentConfig):
         default_factory=lambda: ["L_wheel_j2", "R_wheel_j2"]
     )
 
-    steer_control_pub_topic: str = "control/chassis/steer"
-    steer_state_sub_topic: str = "state/chassis/steer"
-    drive_control_pub_topic: str = "control/chassis/drive"
-    drive_state_sub_topic: str = "state/chassis/drive"
+    # The topics never vary per instance, so keep them as class constants
+    # rather than four extra __init__ parameters and storage slots.
+    steer_control_pub_topic: ClassVar[str] = "control/chassis/steer"
+    steer_state_sub_topic: ClassVar[str] = "state/chassis/steer"
+    drive_control_pub_topic: ClassVar[str] = "control/chassis/drive"
+    drive_state_sub_topic: ClassVar[str] = "state/chassis/drive"
 
     @property
     def joints(self) -> list[str]:
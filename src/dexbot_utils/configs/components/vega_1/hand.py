@@ -1,9 +1,36 @@
 """Hand component configuration."""
 
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import cached_property
+from typing import ClassVar
 
+from ....hand import HandType
 from ..base import BaseJointComponentConfig
 
+# Joint suffix order is shared by both sides; the side prefix is applied
+# once per instance in the cached joints property.
+_F5D6_JOINT_SUFFIXES = ("th_j1", "ff_j1", "mf_j1", "rf_j1", "lf_j1", "th_j0")
+
+# Single dict lookup instead of a compare-and-branch; also raises KeyError
+# on a misspelled side instead of silently treating it as "right".
+_SIDE_PREFIX = {"left": "L", "right": "R"}
+
+# Pose pools are never mutated at runtime, so every instance shares one
+# module-level dict of immutable tuples instead of allocating its own
+# copy per construction. (A MappingProxyType would enforce this but is
+# neither deepcopy- nor pickle-compatible, which the registry relies on.)
+_F5D6_POSE_POOL: Mapping[str, tuple[float, ...]] = {
+    "open": (0.1834, 0.2891, 0.2801, 0.284, 0.2811, -0.0158),
+    "close": (-0.1, -1.0946, -1.0844, -1.0154, -1.0118, 0.84),
+}
+
+_GRIPPER_POSE_POOL: Mapping[str, tuple[float, ...]] = {
+    "open": (0.7854,),
+    "close": (0.0,),
+}
+
 
 @dataclass
 class F5D6HandV1Config(BaseJointComponentConfig):
@@ -18,35 +45,37 @@ class F5D6HandV1Config(BaseJointComponentConfig):
         joints: Property returning list of joint names for the hand
     """
 
+    # Enum tag read by runtime hand-type dispatch instead of mapping on
+    # exact class identity, so subclasses inherit the right value.
+    hand_type: ClassVar[HandType] = HandType.HandF5D6_V1
+
     pv_mode: bool = False
     side: str = "left"
-    pose_pool: dict[str, list[float]] = field(
-        default_factory=lambda: {
-            "open": [0.1834, 0.2891, 0.2801, 0.284, 0.2811, -0.0158],
-            "close": [-0.1, -1.0946, -1.0844, -1.0154, -1.0118, 0.84],
-        }
+    pose_pool: Mapping[str, tuple[float, ...]] = field(
+        default_factory=lambda: _F5D6_POSE_POOL
     )
 
-    @property
+    # Topics and joint names are interned so downstream pub/sub routing
+    # and dict lookups compare by pointer instead of by content.
+    @cached_property
     def state_sub_topic(self) -> str:
-        return f"state/hand/{self.side}"
+        return sys.intern(f"state/hand/{self.side}")
 
-    @property
+    @cached_property
     def control_pub_topic(self) -> str:
-        return f"control/hand/{self.side}"
+        return sys.intern(f"control/hand/{self.side}")
+
+    @cached_property
+    def _joints_cached(self) -> tuple[str, ...]:
+        # Computed once per instance; side is fixed after construction.
+        joint_prefix = _SIDE_PREFIX[self.side]
+        return tuple(
+            sys.intern(f"{joint_prefix}_{suffix}") for suffix in _F5D6_JOINT_SUFFIXES
+        )
 
     @property
-    def joints(self) -> list[str]:
-        joint_prefix = "L" if self.side == "left" else "R"
-        joint_suffixes = [
-            "th_j1",
-            "ff_j1",
-            "mf_j1",
-            "rf_j1",
-            "lf_j1",
-            "th_j0",
-        ]
-        return [f"{joint_prefix}_{suffix}" for suffix in joint_suffixes]
+    def joints(self) -> tuple[str, ...]:
+        return self._joints_cached
 
 
 @dataclass
@@ -59,10 +88,12 @@ class F5D6HandV2Config(F5D6HandV1Config):
         touch_sensor_sub_topic: Property returning topic for touch sensor feedback
     """
 
-    @property
+    hand_type: ClassVar[HandType] = HandType.HandF5D6_V2
+
+    @cached_property
     def touch_sensor_sub_topic(self) -> str:
         # Only for V2 hand
-        return f"state/hand/{self.side}/touch"
+        return sys.intern(f"state/hand/{self.side}/touch")
 
 
 @dataclass
@@ -79,32 +110,35 @@ class DexSGripperConfig(BaseJointComponentConfig):
         joints: Property returning list of joint names for the gripper
     """
 
+    hand_type: ClassVar[HandType] = HandType.DexGripper
+
     pv_mode: bool = False
     side: str = "left"
-    pose_pool: dict[str, list[float]] = field(
-        default_factory=lambda: {
-            "open": [0.7854],
-            "close": [0.0],
-        }
+    pose_pool: Mapping[str, tuple[float, ...]] = field(
+        default_factory=lambda: _GRIPPER_POSE_POOL
     )
 
-    @property
+    @cached_property
     def set_mode_query(self) -> str:
-        return f"mode/gripper/{self.side}"
+        return sys.intern(f"mode/gripper/{self.side}")
 
     # TODO: when gripper auto detection is available, we should use the hand namespace instead of gripper namespace
-    @property
+    @cached_property
     def state_sub_topic(self) -> str:
-        return f"state/gripper/{self.side}"
+        return sys.intern(f"state/gripper/{self.side}")
 
-    @property
+    @cached_property
     def control_pub_topic(self) -> str:
-        return f"control/gripper/{self.side}"
+        return sys.intern(f"control/gripper/{self.side}")
+
+    @cached_property
+    def _joints_cached(self) -> tuple[str, ...]:
+        # Computed once per instance; side is fixed after construction.
+        return (sys.intern(f"{_SIDE_PREFIX[self.side]}_gripper_j1"),)
 
     @property
-    def joints(self) -> list[str]:
-        joint_prefix = "L" if self.side == "left" else "R"
-        return [f"{joint_prefix}_gripper_j1"]
+    def joints(self) -> tuple[str, ...]:
+        return self._joints_cached
 
 
 @dataclass
@@ -1,11 +1,22 @@
 """Head component configuration."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 
 from ..base import BaseJointComponentConfig
 
+# Shared read-only pose pool; see hand.py for the sharing rationale.
+_HEAD_POSE_POOL: Mapping[str, tuple[float, ...]] = {
+    "home": (0.0, 0.0, 0.0),
+    "tucked": (0.0, 0.0, -1.37),
+}
 
-@dataclass
+# Side-independent, so one shared module-level tuple instead of
+# rebuilding a list per property access.
+_HEAD_JOINTS = ("head_j1", "head_j2", "head_j3")
+
+
+@dataclass(slots=True)
 class Vega1HeadConfig(BaseJointComponentConfig):
     """Configuration for Vega robot head component.
 
@@ -23,13 +34,10 @@ class Vega1HeadConfig(BaseJointComponentConfig):
     state_sub_topic: str = "state/head"
     control_pub_topic: str = "control/head"
     set_mode_query: str = "mode/head"
-    pose_pool: dict[str, list[float]] = field(
-        default_factory=lambda: {
-            "home": [0.0, 0.0, 0.0],
-            "tucked": [0.0, 0.0, -1.37],
-        }
+    pose_pool: Mapping[str, tuple[float, ...]] = field(
+        default_factory=lambda: _HEAD_POSE_POOL
     )
 
     @property
-    def joints(self) -> list[str]:
-        return ["head_j1", "head_j2", "head_j3"]
+    def joints(self) -> tuple[str, ...]:
+        return _HEAD_JOINTS
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from ..base import BaseComponentConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class BatteryConfig(BaseComponentConfig):
     """Configuration for battery management system.
 
@@ -16,7 +16,7 @@ class BatteryConfig(BaseComponentConfig):
     state_sub_topic: str = "state/bms"
 
 
-@dataclass
+@dataclass(slots=True)
 class EStopConfig(BaseComponentConfig):
     """Configuration for emergency stop component.
 
@@ -34,7 +34,7 @@ class EStopConfig(BaseComponentConfig):
     monitoring: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class HeartbeatConfig(BaseComponentConfig):
     """Configuration for system heartbeat monitoring.
 
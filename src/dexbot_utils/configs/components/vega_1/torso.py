@@ -1,11 +1,27 @@
 """Torso component configuration."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 
 from ..base import BaseJointComponentConfig
 
-
-@dataclass
+# Shared read-only pose pool; see hand.py for the sharing rationale.
+_TORSO_POSE_POOL: Mapping[str, tuple[float, ...]] = {
+    "home": (0.0, 0.0, 0.0),
+    "folded": (0.0, 0.0, -1.5708),
+    "crouch20_low": (0.0, 0.0, -0.35),
+    "crouch20_medium": (0.52, 1.05, 0.18),
+    "crouch20_high": (0.78, 1.57, 0.44),
+    "crouch45_low": (0.0, 0.0, -0.79),
+    "crouch45_medium": (0.52, 1.05, -0.26),
+    "crouch45_high": (0.78, 1.57, 0),
+    "crouch90_low": (0.0, 0.0, -1.57),
+    "crouch90_medium": (0.52, 1.05, -1.04),
+    "crouch90_high": (0.78, 1.57, -0.78),
+}
+
+
+@dataclass(slots=True)
 class Vega1TorsoConfig(BaseJointComponentConfig):
     """Configuration for Vega robot torso component.
 
@@ -21,20 +37,8 @@ class Vega1TorsoConfig(BaseJointComponentConfig):
     state_sub_topic: str = "state/torso"
     control_pub_topic: str = "control/torso"
 
-    pose_pool: dict[str, list[float]] = field(
-        default_factory=lambda: {
-            "home": [0.0, 0.0, 0.0],
-            "folded": [0.0, 0.0, -1.5708],
-            "crouch20_low": [0.0, 0.0, -0.35],
-            "crouch20_medium": [0.52, 1.05, 0.18],
-            "crouch20_high": [0.78, 1.57, 0.44],
-            "crouch45_low": [0.0, 0.0, -0.79],
-            "crouch45_medium": [0.52, 1.05, -0.26],
-            "crouch45_high": [0.78, 1.57, 0],
-            "crouch90_low": [0.0, 0.0, -1.57],
-            "crouch90_medium": [0.52, 1.05, -1.04],
-            "crouch90_high": [0.78, 1.57, -0.78],
-        }
+    pose_pool: Mapping[str, tuple[float, ...]] = field(
+        default_factory=lambda: _TORSO_POSE_POOL
     )
 
     @property
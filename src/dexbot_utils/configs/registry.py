@@ -1,11 +1,33 @@
 """Configuration registry for robot variants."""
 
+import importlib
+import pickle
+import sys
 from typing import Callable, ClassVar, TypeVar
 
 from .robots.base import BaseRobotConfig
 
 T = TypeVar("T", bound=BaseRobotConfig)
 
+# Modules that register the built-in variants. They are imported lazily on
+# first registry access so that importing the configs package stays cheap.
+_VARIANT_MODULES = (
+    ".robots.vega_1",
+    ".robots.vega_1p",
+    ".robots.vega_1u",
+)
+
+_variants_loaded = False
+
+
+def _ensure_variants_loaded() -> None:
+    """Import the built-in variant modules once, on first registry use."""
+    global _variants_loaded
+    if not _variants_loaded:
+        _variants_loaded = True
+        for module_name in _VARIANT_MODULES:
+            importlib.import_module(module_name, __package__)
+
 
 def register_variant(variant: str) -> Callable[[type[T]], type[T]]:
     """Decorator to register a robot configuration variant.
@@ -42,6 +64,19 @@ class ConfigRegistry:
 
     _registry: ClassVar[dict[str, type[BaseRobotConfig]]] = {}
 
+    # One fully-built instance per variant; get() hands out copies so that
+    # repeated lookups skip re-running the dataclass factories while callers
+    # can still mutate their config freely.
+    _prototypes: ClassVar[dict[str, BaseRobotConfig]] = {}
+
+    # Pre-serialized prototypes; pickle.loads beats copy.deepcopy on these
+    # dataclass trees because it skips the memo dict and per-object
+    # __reduce_ex__ dispatch.
+    _pickles: ClassVar[dict[str, bytes]] = {}
+
+    # Cached list_variants() result; invalidated by register().
+    _variants_tuple: ClassVar[tuple[str, ...] | None] = None
+
     @classmethod
     def register(cls, variant: str, config_class: type[BaseRobotConfig]) -> None:
         """Register a robot configuration variant.
@@ -50,12 +85,66 @@ class ConfigRegistry:
             variant: Variant name (e.g., "vega_1", "vega_1u")
             config_class: Configuration dataclass for the variant
         """
-        cls._registry[variant] = config_class
+        # Interned keys make the frequent get() lookups pointer-compares.
+        cls._registry[sys.intern(variant)] = config_class
+        cls._prototypes.pop(variant, None)
+        cls._pickles.pop(variant, None)
+        cls._variants_tuple = None
+
+    @classmethod
+    def _get_prototype(cls, variant: str) -> BaseRobotConfig:
+        """Get the shared, read-only prototype instance for a variant.
+
+        Intended for internal callers that only read metadata (e.g. the
+        abbreviation scan in ``_helpers``) and must not mutate the result.
+
+        Args:
+            variant: Variant name
+
+        Returns:
+            Cached configuration instance for the variant
+
+        Raises:
+            ValueError: If variant is not registered
+        """
+        _ensure_variants_loaded()
+        prototype = cls._prototypes.get(variant)
+        if prototype is None:
+            if variant not in cls._registry:
+                raise ValueError(
+                    f"Unknown robot variant: '{variant}'. "
+                    f"Available variants: {list(cls._registry.keys())}"
+                )
+            prototype = cls._registry[variant]()
+            cls._prototypes[variant] = prototype
+        return prototype
+
+    @classmethod
+    def get_shared(cls, variant: str) -> BaseRobotConfig:
+        """Get the shared, read-only instance for a variant.
+
+        Skips the copy that :meth:`get` performs, so repeated lookups are
+        a single dict hit. The returned instance is shared process-wide
+        and must not be mutated; use :meth:`get` for a mutable copy.
+
+        Args:
+            variant: Variant name
+
+        Returns:
+            Shared configuration instance for the variant
+
+        Raises:
+            ValueError: If variant is not registered
+        """
+        return cls._get_prototype(variant)
 
     @classmethod
     def get(cls, variant: str) -> BaseRobotConfig:
         """Get a robot configuration instance.
 
+        Each call returns an independent copy, so callers may mutate the
+        result without affecting later lookups.
+
         Args:
             variant: Variant name
 
@@ -65,14 +154,13 @@ class ConfigRegistry:
         Raises:
             ValueError: If variant is not registered
         """
-        if variant not in cls._registry:
-            raise ValueError(
-                f"Unknown robot variant: '{variant}'. "
-                f"Available variants: {list(cls._registry.keys())}"
+        blob = cls._pickles.get(variant)
+        if blob is None:
+            blob = pickle.dumps(
+                cls._get_prototype(variant), protocol=pickle.HIGHEST_PROTOCOL
             )
-
-        config_class = cls._registry[variant]
-        return config_class()
+            cls._pickles[variant] = blob
+        return pickle.loads(blob)
 
     @classmethod
     def list_variants(cls) -> list[str]:
@@ -81,7 +169,10 @@ class ConfigRegistry:
         Returns:
             List of variant names
         """
-        return list(cls._registry.keys())
+        _ensure_variants_loaded()
+        if cls._variants_tuple is None:
+            cls._variants_tuple = tuple(cls._registry)
+        return list(cls._variants_tuple)
 
 
 def get_robot_config(variant: str) -> BaseRobotConfig:
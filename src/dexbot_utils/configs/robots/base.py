@@ -1,9 +1,175 @@
+import sys
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
+from typing import Any
 
 from ..components.base import BaseComponentConfig
 
 
-@dataclass
+class _Unrealized:
+    """Singleton placeholder for values not yet built by LazyConfigDict.
+
+    Identity is preserved across copy, deepcopy and pickle so that copied
+    configs keep their pending entries lazy.
+    """
+
+    _instance = None
+
+    def __new__(cls) -> "_Unrealized":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __repr__(self) -> str:
+        return "<unrealized>"
+
+    def __reduce__(self):
+        return (_Unrealized, ())
+
+    def __copy__(self) -> "_Unrealized":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "_Unrealized":
+        return self
+
+
+_UNREALIZED = _Unrealized()
+
+# Default marker for LazyConfigDict.pop, distinct from any caller value.
+_POP_MISSING = object()
+
+
+class LazyConfigDict(dict):
+    """Component dict that constructs its configs on first access.
+
+    All keys are visible immediately (membership tests, ``len`` and key
+    iteration stay O(1) per key), but each value is built from its
+    zero-argument factory only when first read. Loading a variant config
+    therefore skips instantiating components the caller never touches.
+
+    Factories must be picklable — use ``functools.partial`` or a bare
+    config class rather than a lambda — because variant configs are
+    copied and cached by the registry.
+    """
+
+    def __init__(
+        self, factories: Mapping[str, Callable[[], Any]] | None = None
+    ) -> None:
+        super().__init__()
+        self._factories: dict[str, Callable[[], Any]] = {}
+        if factories:
+            for key, factory in factories.items():
+                # Interned keys keep membership tests on the identity
+                # fast path, also after a pickle round trip (unpickled
+                # strings are not interned by default).
+                key = sys.intern(key)
+                self._factories[key] = factory
+                dict.__setitem__(self, key, _UNREALIZED)
+
+    def __getitem__(self, key: str) -> Any:
+        value = dict.__getitem__(self, key)
+        if value is _UNREALIZED:
+            value = self._factories.pop(key)()
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        key = sys.intern(key)
+        self._factories.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def values(self) -> list[Any]:  # type: ignore[override]
+        return [self[key] for key in self]
+
+    def items(self) -> list[tuple[str, Any]]:  # type: ignore[override]
+        return [(key, self[key]) for key in self]
+
+    # The placeholder must never escape through a standard mapping
+    # operation, so every dict API that returns or copies values is
+    # overridden to realize (or, for copy, to carry the factories along).
+
+    def __iter__(self):
+        # Same iteration as dict, but a Python-level override keeps
+        # CPython's dict(d) / {**d} / other.update(d) fast path — which
+        # would copy the internal table, placeholders included — off this
+        # type, routing those through keys() and __getitem__ instead.
+        return dict.__iter__(self)
+
+    def pop(self, key: str, default: Any = _POP_MISSING) -> Any:
+        try:
+            value = self[key]
+        except KeyError:
+            if default is _POP_MISSING:
+                raise
+            return default
+        dict.__delitem__(self, key)
+        return value
+
+    def popitem(self) -> tuple[str, Any]:
+        key, value = dict.popitem(self)
+        if value is _UNREALIZED:
+            value = self._factories.pop(key)()
+        return key, value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            self[key] = default
+            return default
+
+    def copy(self) -> "LazyConfigDict":
+        # Pending entries stay lazy in the copy; both dicts then hold the
+        # same factory, which is fine because factories are stateless.
+        realized = {
+            key: value for key, value in dict.items(self) if value is not _UNREALIZED
+        }
+        return _rebuild_lazy_config_dict(dict(self._factories), realized)
+
+    def __or__(self, other: Any) -> dict[str, Any]:
+        merged = dict(self.items())
+        merged.update(other)
+        return merged
+
+    def __ror__(self, other: Any) -> dict[str, Any]:
+        merged = dict(other)
+        merged.update(self.items())
+        return merged
+
+    def __eq__(self, other: Any) -> bool:
+        # Realizes every entry; equality is only meaningful on the built
+        # configs, not on the placeholders.
+        return dict(self.items()) == other
+
+    __hash__ = None  # type: ignore[assignment]  # dicts are unhashable
+
+    def __reduce__(self):
+        # Default dict-subclass reduction serializes via items(), which
+        # would realize every pending entry; rebuild from the factories
+        # instead so copies and pickles stay lazy.
+        realized = {
+            key: value for key, value in dict.items(self) if value is not _UNREALIZED
+        }
+        return (_rebuild_lazy_config_dict, (self._factories, realized))
+
+
+def _rebuild_lazy_config_dict(
+    factories: dict[str, Callable[[], Any]], realized: dict[str, Any]
+) -> LazyConfigDict:
+    """Reconstruct a LazyConfigDict from pending factories and realized values."""
+    lazy = LazyConfigDict(factories)
+    for key, value in realized.items():
+        lazy[key] = value
+    return lazy
+
+
+@dataclass(slots=True)
 class BaseRobotConfig:
     """Base configuration for a robot.
 
@@ -52,3 +218,27 @@ class BaseRobotConfig:
                 f"Available sensors: {available}"
             )
         self.sensors[name].enabled = True
+
+    def enable_sensors(self, names: Iterable[str]) -> None:
+        """Enable several sensors at once.
+
+        Validates every name up front with a single set difference, so a
+        bad batch raises before any sensor is enabled.
+
+        Args:
+            names: Sensor names (e.g., ["ultrasonic", "head_imu"]).
+
+        Raises:
+            KeyError: If any name is not available on this robot
+                configuration; the message lists all missing names.
+        """
+        names = list(names)
+        missing = set(names) - self.sensors.keys()
+        if missing:
+            available = ", ".join(sorted(self.sensors.keys())) or "none"
+            raise KeyError(
+                f"Sensors {sorted(missing)} are not available on robot config "
+                f"'{type(self).__name__}'. Available sensors: {available}"
+            )
+        for name in names:
+            self.sensors[name].enabled = True
@@ -24,7 +24,7 @@ from .base import BaseComponentConfig, BaseRobotConfig
 
 
 @register_variant("vega_1")
-@dataclass
+@dataclass(slots=True)
 class Vega1Config(BaseRobotConfig):
     """Configuration for Vega-1 robot base (no hands)."""
 
@@ -70,7 +70,7 @@ class Vega1Config(BaseRobotConfig):
 
 
 @register_variant("vega_1_f5d6")
-@dataclass
+@dataclass(slots=True)
 class Vega1F5D6Config(Vega1Config):
     """Configuration for Vega-1 robot with F5D6 hands."""
 
@@ -93,7 +93,7 @@ class Vega1F5D6Config(Vega1Config):
 
 
 @register_variant("vega_1_gripper")
-@dataclass
+@dataclass(slots=True)
 class Vega1DGripperConfig(Vega1Config):
     """Configuration for Vega-1 robot with D-gripper hands and wrist cameras."""
 
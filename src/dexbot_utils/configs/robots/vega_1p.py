@@ -1,6 +1,7 @@
 """Vega-1p robot configurations."""
 
 from dataclasses import dataclass, field
+from functools import partial
 
 from dexmate_urdf import robots
 
@@ -19,11 +20,31 @@ from ..components.vega_1 import (
     Vega1TorsoConfig,
 )
 from ..registry import register_variant
-from .base import BaseComponentConfig, BaseRobotConfig
+from .base import BaseComponentConfig, BaseRobotConfig, LazyConfigDict
+
+# Factory tables shared by every Vega-1p variant; the hand variants
+# overlay their two hand entries instead of redeclaring the full block.
+_VEGA1P_BASE_COMPONENTS = {
+    "left_arm": partial(Vega1ArmConfig, side="left"),
+    "right_arm": partial(Vega1ArmConfig, side="right"),
+    "torso": Vega1TorsoConfig,
+    "chassis": Vega1ChassisConfig,
+    "head": Vega1HeadConfig,
+    "battery": BatteryConfig,
+    "estop": EStopConfig,
+    "heartbeat": HeartbeatConfig,
+}
+
+_VEGA1P_BASE_SENSORS = {
+    "head_camera": partial(ZedXCameraConfig, name="head_camera"),
+    "head_imu": partial(ZedIMUConfig, name="head_imu"),
+    "lidar_3d_front": partial(Lidar3DConfig, name="lidar_3d_front"),
+    "lidar_3d_back": partial(Lidar3DConfig, name="lidar_3d_back"),
+}
 
 
 @register_variant("vega_1p")
-@dataclass
+@dataclass(slots=True)
 class Vega1pConfig(BaseRobotConfig):
     """Configuration for Vega-1p robot base (no hands)."""
 
@@ -32,25 +53,11 @@ class Vega1pConfig(BaseRobotConfig):
     urdf_path: str = str(robots.humanoid.vega_1p.vega_1p.urdf)
 
     components: dict[str, BaseComponentConfig] = field(
-        default_factory=lambda: {
-            "left_arm": Vega1ArmConfig(side="left"),
-            "right_arm": Vega1ArmConfig(side="right"),
-            "torso": Vega1TorsoConfig(),
-            "chassis": Vega1ChassisConfig(),
-            "head": Vega1HeadConfig(),
-            "battery": BatteryConfig(),
-            "estop": EStopConfig(),
-            "heartbeat": HeartbeatConfig(),
-        }
+        default_factory=lambda: LazyConfigDict(_VEGA1P_BASE_COMPONENTS)
     )
 
     sensors: dict[str, BaseComponentConfig] = field(
-        default_factory=lambda: {
-            "head_camera": ZedXCameraConfig(name="head_camera"),
-            "head_imu": ZedIMUConfig(name="head_imu"),
-            "lidar_3d_front": Lidar3DConfig(name="lidar_3d_front"),
-            "lidar_3d_back": Lidar3DConfig(name="lidar_3d_back")
-        }
+        default_factory=lambda: LazyConfigDict(_VEGA1P_BASE_SENSORS)
     )
 
     querables: dict[str, str] = field(
@@ -68,57 +75,46 @@ class Vega1pConfig(BaseRobotConfig):
 
 
 @register_variant("vega_1p_f5d6")
-@dataclass
+@dataclass(slots=True)
 class Vega1pF5D6Config(Vega1pConfig):
     """Configuration for Vega-1p robot with F5D6 hands."""
 
     urdf_path: str = str(robots.humanoid.vega_1p.vega_1p_f5d6.urdf)
 
     components: dict[str, BaseComponentConfig] = field(
-        default_factory=lambda: {
-            "left_arm": Vega1ArmConfig(side="left"),
-            "right_arm": Vega1ArmConfig(side="right"),
-            "torso": Vega1TorsoConfig(),
-            "chassis": Vega1ChassisConfig(),
-            "head": Vega1HeadConfig(),
-            "left_hand": F5D6HandV2Config(side="left"),
-            "right_hand": F5D6HandV2Config(side="right"),
-            "battery": BatteryConfig(),
-            "estop": EStopConfig(),
-            "heartbeat": HeartbeatConfig(),
-        }
+        default_factory=lambda: LazyConfigDict(
+            {
+                **_VEGA1P_BASE_COMPONENTS,
+                "left_hand": partial(F5D6HandV2Config, side="left"),
+                "right_hand": partial(F5D6HandV2Config, side="right"),
+            }
+        )
     )
 
 
 @register_variant("vega_1p_gripper")
-@dataclass
+@dataclass(slots=True)
 class Vega1pDGripperConfig(Vega1pConfig):
     """Configuration for Vega-1p robot with D-gripper hands and wrist cameras."""
 
     urdf_path: str = str(robots.humanoid.vega_1p.vega_1p_gripper.urdf)
 
     components: dict[str, BaseComponentConfig] = field(
-        default_factory=lambda: {
-            "left_arm": Vega1ArmConfig(side="left"),
-            "right_arm": Vega1ArmConfig(side="right"),
-            "torso": Vega1TorsoConfig(),
-            "chassis": Vega1ChassisConfig(),
-            "head": Vega1HeadConfig(),
-            "left_hand": DexDGripperConfig(side="left"),
-            "right_hand": DexDGripperConfig(side="right"),
-            "battery": BatteryConfig(),
-            "estop": EStopConfig(),
-            "heartbeat": HeartbeatConfig(),
-        }
+        default_factory=lambda: LazyConfigDict(
+            {
+                **_VEGA1P_BASE_COMPONENTS,
+                "left_hand": partial(DexDGripperConfig, side="left"),
+                "right_hand": partial(DexDGripperConfig, side="right"),
+            }
+        )
     )
 
     sensors: dict[str, BaseComponentConfig] = field(
-        default_factory=lambda: {
-            "head_camera": ZedXCameraConfig(name="head_camera"),
-            "head_imu": ZedIMUConfig(name="head_imu"),
-            "lidar_3d_front": Lidar3DConfig(name="lidar_3d_front"),
-            "lidar_3d_back": Lidar3DConfig(name="lidar_3d_back"),
-            "left_wrist_camera": ZedXOneCameraConfig(side="left"),
-            "right_wrist_camera": ZedXOneCameraConfig(side="right"),
-        }
+        default_factory=lambda: LazyConfigDict(
+            {
+                **_VEGA1P_BASE_SENSORS,
+                "left_wrist_camera": partial(ZedXOneCameraConfig, side="left"),
+                "right_wrist_camera": partial(ZedXOneCameraConfig, side="right"),
+            }
+        )
     )
@@ -1,6 +1,7 @@
 """Vega-1u (Upper Body) robot configurations."""
 
 from dataclasses import dataclass, field
+from functools import partial
 
 from dexmate_urdf import robots
 
@@ -14,11 +15,21 @@ from ..components.vega_1 import (
     Vega1HeadConfig,
 )
 from ..registry import register_variant
-from .base import BaseComponentConfig, BaseRobotConfig
+from .base import BaseComponentConfig, BaseRobotConfig, LazyConfigDict
+
+# Factory table shared by every Vega-1u variant; the hand variants
+# overlay their two hand entries instead of redeclaring the full block.
+_VEGA1U_BASE_COMPONENTS = {
+    "left_arm": partial(Vega1ArmConfig, side="left"),
+    "right_arm": partial(Vega1ArmConfig, side="right"),
+    "head": Vega1HeadConfig,
+    "estop": EStopConfig,
+    "heartbeat": HeartbeatConfig,
+}
 
 
 @register_variant("vega_1u")
-@dataclass
+@dataclass(slots=True)
 class Vega1UConfig(BaseRobotConfig):
     """Configuration for Vega-1 Upper Body robot base (no hands)."""
 
@@ -27,13 +38,7 @@ class Vega1UConfig(BaseRobotConfig):
     urdf_path: str = str(robots.humanoid.vega_1u.vega_1u.urdf)
 
     components: dict[str, BaseComponentConfig] = field(
-        default_factory=lambda: {
-            "left_arm": Vega1ArmConfig(side="left"),
-            "right_arm": Vega1ArmConfig(side="right"),
-            "head": Vega1HeadConfig(),
-            "estop": EStopConfig(),
-            "heartbeat": HeartbeatConfig(),
-        }
+        default_factory=lambda: LazyConfigDict(_VEGA1U_BASE_COMPONENTS)
     )
     querables: dict[str, str] = field(
         default_factory=lambda: {
@@ -48,55 +53,55 @@ class Vega1UConfig(BaseRobotConfig):
         }
     )
     sensors: dict[str, BaseComponentConfig] = field(
-        default_factory=lambda: {
-            "head_camera": ZedXCameraConfig(name="head_camera"),
-        }
+        default_factory=lambda: LazyConfigDict(
+            {
+                "head_camera": partial(ZedXCameraConfig, name="head_camera"),
+            }
+        )
     )
 
 
 @register_variant("vega_1u_f5d6")
-@dataclass
+@dataclass(slots=True)
 class Vega1UF5D6Config(Vega1UConfig):
     """Configuration for Vega-1 Upper Body robot with F5D6 hands."""
 
     urdf_path: str = str(robots.humanoid.vega_1u.vega_1u_f5d6.urdf)
 
     components: dict[str, BaseComponentConfig] = field(
-        default_factory=lambda: {
-            "left_arm": Vega1ArmConfig(side="left"),
-            "right_arm": Vega1ArmConfig(side="right"),
-            "head": Vega1HeadConfig(),
-            "left_hand": F5D6HandV2Config(side="left"),
-            "right_hand": F5D6HandV2Config(side="right"),
-            "estop": EStopConfig(),
-            "heartbeat": HeartbeatConfig(),
-        }
+        default_factory=lambda: LazyConfigDict(
+            {
+                **_VEGA1U_BASE_COMPONENTS,
+                "left_hand": partial(F5D6HandV2Config, side="left"),
+                "right_hand": partial(F5D6HandV2Config, side="right"),
+            }
+        )
     )
 
 
 @register_variant("vega_1u_gripper")
-@dataclass
+@dataclass(slots=True)
 class Vega1UDGripperConfig(Vega1UConfig):
     """Configuration for Vega-1 Upper Body robot with D-gripper hands and wrist cameras."""
 
     urdf_path: str = str(robots.humanoid.vega_1u.vega_1u_gripper.urdf)
 
     components: dict[str, BaseComponentConfig] = field(
-        default_factory=lambda: {
-            "left_arm": Vega1ArmConfig(side="left"),
-            "right_arm": Vega1ArmConfig(side="right"),
-            "head": Vega1HeadConfig(),
-            "left_hand": DexDGripperConfig(side="left"),
-            "right_hand": DexDGripperConfig(side="right"),
-            "estop": EStopConfig(),
-            "heartbeat": HeartbeatConfig(),
-        }
+        default_factory=lambda: LazyConfigDict(
+            {
+                **_VEGA1U_BASE_COMPONENTS,
+                "left_hand": partial(DexDGripperConfig, side="left"),
+                "right_hand": partial(DexDGripperConfig, side="right"),
+            }
+        )
     )
 
     sensors: dict[str, BaseComponentConfig] = field(
-        default_factory=lambda: {
-            "head_camera": ZedXCameraConfig(name="head_camera"),
-            "left_wrist_camera": ZedXOneCameraConfig(side="left"),
-            "right_wrist_camera": ZedXOneCameraConfig(side="right"),
-        }
+        default_factory=lambda: LazyConfigDict(
+            {
+                "head_camera": partial(ZedXCameraConfig, name="head_camera"),
+                "left_wrist_camera": partial(ZedXOneCameraConfig, side="left"),
+                "right_wrist_camera": partial(ZedXOneCameraConfig, side="right"),
+            }
+        )
     )
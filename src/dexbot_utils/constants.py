@@ -10,7 +10,11 @@ ROBOT_CONFIG_FILE_ENV_VAR = "ROBOT_CONFIG"
 # Compiled regex pattern for robot name validation (performance optimization)
 # Format: dm/[abbr][serial]-[version][suffix]
 # Examples: dm/vgabcd123456-1, dm/vg0123456789-1p (p=pro), dm/vg0123456789-1u (u=upper)
-ROBOT_NAME_PATTERN = re.compile(r"^dm/[a-zA-Z0-9]{12}-(?:\d+[a-z]?|rc\d+)$")
+# The named groups let callers pull the abbreviation and version straight
+# from the validating match instead of re-tokenizing the name.
+ROBOT_NAME_PATTERN = re.compile(
+    r"^dm/(?P<abbr>[a-zA-Z0-9]{2})[a-zA-Z0-9]{10}-(?P<ver>\d+[a-z]?|rc\d+)$"
+)
 
 # Version suffix to variant suffix mapping
 VERSION_SUFFIX_MAPPING = {
@@ -4,6 +4,7 @@ This module provides the RobotInfo class, which combines robot configuration
 and URDF data to provide a comprehensive robot information API.
 """
 
+import functools
 import os
 from pathlib import Path
 from typing import Any
@@ -11,7 +12,7 @@ from typing import Any
 import numpy as np
 from loguru import logger
 
-from ._helpers import ROBOT_TYPE_ABB_MAPPING
+from ._helpers import build_robot_type_mappings
 from .configs import get_robot_config
 from .configs.components import BaseComponentConfig
 from .configs.robots.base import BaseRobotConfig
@@ -23,6 +24,53 @@ from .constants import (
 from .urdf_utils import JointLimit, URDFParser
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_variant(config_value: str | None, robot_name: str) -> str:
+    """Resolve a variant name from env var values.
+
+    Memoized on the raw env values so that repeated resolutions with an
+    unchanged environment skip the string parsing. Failed resolutions
+    raise and are not cached.
+
+    Args:
+        config_value: Value of the ROBOT_CONFIG env var, or None.
+        robot_name: Value of the ROBOT_NAME env var, or empty string.
+
+    Returns:
+        Variant name
+
+    Raises:
+        ValueError: If neither value is set
+    """
+    # Try ROBOT_CONFIG first
+    if config_value:
+        # Remove .py extension if present
+        return config_value.replace(".py", "")
+
+    # Fallback to ROBOT_NAME
+    if robot_name:
+        return RobotInfo._derive_variant_from_robot_name(robot_name)
+
+    # No env vars set
+    raise ValueError(
+        f"Variant not specified and neither {ROBOT_CONFIG_FILE_ENV_VAR} "
+        f"nor {ROBOT_NAME_ENV_VAR} environment variables are set. "
+        f"Either provide variant parameter or set one of these environment variables."
+    )
+
+
+@functools.cache
+def _dexmate_urdf_root() -> Path:
+    """Get the installation root of the dexmate_urdf package.
+
+    Cached so that relative URDF paths resolve without re-running the
+    import machinery for every RobotInfo instance.
+    """
+    import dexmate_urdf
+
+    return Path(dexmate_urdf.__path__[0])
+
+
 class RobotInfo:
     """High-level interface for robot configuration and URDF information.
 
@@ -86,6 +134,22 @@ class RobotInfo:
             # Load dataclass configuration from registry
             self._config = get_robot_config(variant)
 
+        # robot_model is immutable per instance, so split it once instead of
+        # re-scanning the string on every robot_type/robot_version access.
+        model = self._config.robot_model
+        head, sep, tail = model.rpartition("_")
+        self._robot_type = head if sep else model
+        self._robot_version = tail if sep else ""
+
+        # Modifiers can add components after construction (e.g. runtime hand
+        # detection), so membership queries read the live component dict.
+        # The frozenset handed to the validators is cached per key count in
+        # _component_key_set below.
+        self._component_key_cache: frozenset[str] | None = None
+        # Computed on first get_pv_components() call; scanning here would
+        # force every lazily-built component config to be realized.
+        self._pv_components: tuple[str, ...] | None = None
+
         # Auto-load URDF if specified in config
         if self._config.urdf_path:
             try:
@@ -113,22 +177,13 @@ class RobotInfo:
         Raises:
             ValueError: If no env vars set
         """
-        # Try ROBOT_CONFIG first
-        variant = os.getenv(ROBOT_CONFIG_FILE_ENV_VAR)
-        if variant:
-            # Remove .py extension if present
-            return variant.replace(".py", "")
-
-        # Fallback to ROBOT_NAME
-        robot_name = os.getenv(ROBOT_NAME_ENV_VAR, "")
-        if robot_name:
-            return RobotInfo._derive_variant_from_robot_name(robot_name)
-
-        # No env vars set
-        raise ValueError(
-            f"Variant not specified and neither {ROBOT_CONFIG_FILE_ENV_VAR} "
-            f"nor {ROBOT_NAME_ENV_VAR} environment variables are set. "
-            f"Either provide variant parameter or set one of these environment variables."
+        # Delegate to the memoized resolver keyed on the current env values,
+        # so repeated RobotInfo() constructions with unchanged env skip the
+        # string parsing. Tests that mutate env still work: a different
+        # value is a different cache key.
+        return _resolve_variant(
+            os.getenv(ROBOT_CONFIG_FILE_ENV_VAR),
+            os.getenv(ROBOT_NAME_ENV_VAR, ""),
         )
 
     @staticmethod
@@ -170,26 +225,29 @@ class RobotInfo:
         Raises:
             ValueError: If robot name format is invalid
         """
-        if not ROBOT_NAME_PATTERN.match(robot_name):
+        match = ROBOT_NAME_PATTERN.match(robot_name)
+        if not match:
             raise ValueError(
                 f"Invalid robot name format: {robot_name}. "
                 f"Expected format: dm/[abbreviation][serial]-[version][suffix] "
                 f"(e.g., 'dm/vgabcd123456-1', 'dm/vg0123456789-1p', 'dm/vg0123456789-1u')"
             )
 
-        # Parse: "dm/vgabcd123456-1p" -> ["dm", "vgabcd123456", "1p"]
-        parts = robot_name.replace("/", "-").split("-")
-        robot_abbr = parts[1][:2]  # First 2 chars: "vg"
-        version_part = parts[-1]  # Last part: "1", "1p", "1u", or "rc2"
+        # The validating match already captured both pieces:
+        # "dm/vgabcd123456-1p" -> abbr "vg", version "1p"
+        robot_abbr = match["abbr"]
+        version_part = match["ver"]
 
-        # Look up robot type from abbreviation
-        if robot_abbr not in ROBOT_TYPE_ABB_MAPPING:
+        # Look up robot type from abbreviation (mappings are built lazily
+        # and cached by the helper)
+        abb_mapping = build_robot_type_mappings().abbr_to_type
+        if robot_abbr not in abb_mapping:
             raise ValueError(
                 f"Unknown robot abbreviation: {robot_abbr}. "
-                f"Valid abbreviations: {list(ROBOT_TYPE_ABB_MAPPING.keys())}"
+                f"Valid abbreviations: {list(abb_mapping.keys())}"
             )
 
-        robot_type = ROBOT_TYPE_ABB_MAPPING[robot_abbr]
+        robot_type = abb_mapping[robot_abbr]
 
         # Build variant name with underscore separator
         # "1p" -> "vega_1p", "1" -> "vega_1", "1u" -> "vega_1u", "rc2" -> "vega_rc2"
@@ -231,8 +289,7 @@ class RobotInfo:
 
         Extracts type from model (e.g., "vega_1" -> "vega").
         """
-        parts = self._config.robot_model.rsplit("_", 1)
-        return parts[0] if len(parts) > 1 else self._config.robot_model
+        return self._robot_type
 
     @property
     def robot_version(self) -> str:
@@ -240,8 +297,7 @@ class RobotInfo:
 
         Extracts version from model (e.g., "vega_1" -> "1").
         """
-        parts = self._config.robot_model.rsplit("_", 1)
-        return parts[1] if len(parts) > 1 else ""
+        return self._robot_version
 
     # =========================================================================
     # URDF Management
@@ -255,10 +311,7 @@ class RobotInfo:
         """
         urdf_path = Path(urdf_path)
         if not urdf_path.is_absolute():
-            import dexmate_urdf
-
-            dexmate_urdf_path = Path(dexmate_urdf.__path__[0])
-            urdf_path = dexmate_urdf_path / urdf_path
+            urdf_path = _dexmate_urdf_root() / urdf_path
 
         self._urdf_path = urdf_path
         self._urdf_parser = URDFParser(self._urdf_path)
@@ -277,13 +330,27 @@ class RobotInfo:
     # Component Access
     # =========================================================================
 
+    @property
+    def _component_key_set(self) -> frozenset[str]:
+        """Component names as a frozenset tracking the live config.
+
+        Rebuilt when the component count changes: modifiers only ever add
+        components, so a changed length is the invalidation signal.
+        """
+        components = self._config.components
+        cached = self._component_key_cache
+        if cached is None or len(cached) != len(components):
+            cached = frozenset(components)
+            self._component_key_cache = cached
+        return cached
+
     def get_component_list(self) -> list[str]:
         """Get list of component names for this robot.
 
         Returns:
             List of component names (e.g., ['left_arm', 'right_arm', ...])
         """
-        return list(self._config.components.keys())
+        return list(self._config.components)
 
     def has_component(self, component: str) -> bool:
         """Check if robot has a specific component.
@@ -311,7 +378,7 @@ class RobotInfo:
         if component not in self._config.components:
             raise KeyError(
                 f"Component '{component}' not found. "
-                f"Available: {list(self._config.components.keys())}"
+                f"Available: {list(self._config.components)}"
             )
         return self._config.components[component]
 
@@ -392,11 +459,13 @@ class RobotInfo:
         Returns:
             List of component names that use PV mode
         """
-        pv_components = []
-        for name, comp_config in self._config.components.items():
-            if hasattr(comp_config, "pv_mode") and comp_config.pv_mode:  # type: ignore[attr-defined]
-                pv_components.append(name)
-        return pv_components
+        if self._pv_components is None:
+            self._pv_components = tuple(
+                name
+                for name, comp_config in self._config.components.items()
+                if getattr(comp_config, "pv_mode", False)
+            )
+        return list(self._pv_components)
 
     # =========================================================================
     # Component Boolean Properties
@@ -405,42 +474,57 @@ class RobotInfo:
     @property
     def has_left_arm(self) -> bool:
         """Check if robot has left arm."""
-        return self.has_component("left_arm")
+        return "left_arm" in self._config.components
 
     @property
     def has_right_arm(self) -> bool:
         """Check if robot has right arm."""
-        return self.has_component("right_arm")
+        return "right_arm" in self._config.components
 
     @property
     def has_left_hand(self) -> bool:
         """Check if robot has left hand."""
-        return self.has_component("left_hand")
+        return "left_hand" in self._config.components
 
     @property
     def has_right_hand(self) -> bool:
         """Check if robot has right hand."""
-        return self.has_component("right_hand")
+        return "right_hand" in self._config.components
 
     @property
     def has_torso(self) -> bool:
         """Check if robot has torso."""
-        return self.has_component("torso")
+        return "torso" in self._config.components
 
     @property
     def has_head(self) -> bool:
         """Check if robot has head."""
-        return self.has_component("head")
+        return "head" in self._config.components
 
     @property
     def has_chassis(self) -> bool:
         """Check if robot has chassis."""
-        return self.has_component("chassis")
+        return "chassis" in self._config.components
 
     # =========================================================================
     # URDF Queries (delegated to URDFParser)
     # =========================================================================
 
+    def _require_urdf(self) -> URDFParser:
+        """Get the loaded URDF parser, raising if none is loaded.
+
+        Centralizes the guard the query wrappers used to repeat, so each
+        wrapper is one attribute read plus an identity check before
+        delegating to the parser.
+
+        Raises:
+            RuntimeError: If URDF not loaded
+        """
+        parser = self._urdf_parser
+        if parser is None:
+            raise RuntimeError("URDF not loaded. Call load_urdf() first.")
+        return parser
+
     def get_joint_names(self, joint_type: str | None = None) -> list[str]:
         """Get joint names from URDF.
 
@@ -453,9 +537,7 @@ class RobotInfo:
         Raises:
             RuntimeError: If URDF not loaded
         """
-        if not self.has_urdf or self._urdf_parser is None:
-            raise RuntimeError("URDF not loaded. Call load_urdf() first.")
-        return self._urdf_parser.get_joint_names(joint_type)
+        return self._require_urdf().get_joint_names(joint_type)
 
     def get_movable_joint_names(self) -> list[str]:
         """Get names of movable joints from URDF.
@@ -466,9 +548,7 @@ class RobotInfo:
         Raises:
             RuntimeError: If URDF not loaded
         """
-        if not self.has_urdf or self._urdf_parser is None:
-            raise RuntimeError("URDF not loaded. Call load_urdf() first.")
-        return self._urdf_parser.get_movable_joint_names()
+        return self._require_urdf().get_movable_joint_names()
 
     def get_joint_limits(
         self, joint_names: list[str] | None = None
@@ -484,9 +564,7 @@ class RobotInfo:
         Raises:
             RuntimeError: If URDF not loaded
         """
-        if not self.has_urdf or self._urdf_parser is None:
-            raise RuntimeError("URDF not loaded. Call load_urdf() first.")
-        return self._urdf_parser.get_joint_limits(joint_names)
+        return self._require_urdf().get_joint_limits(joint_names)
 
     def get_joint_pos_limits(self, joint_names: list[str] | None = None) -> np.ndarray:
         """Get position limits (lower, upper) for joints from URDF.
@@ -497,7 +575,8 @@ class RobotInfo:
 
         Returns:
             Numpy array of shape (N, 2) where N is number of joints.
-            Each row is [lower, upper] for a joint.
+            Each row is [lower, upper] for a joint. The array is a fresh
+            writable copy, safe to modify in place.
 
         Raises:
             RuntimeError: If URDF not loaded
@@ -510,16 +589,9 @@ class RobotInfo:
             >>> pos_limits[0]  # First joint limits
             array([-1.57,  1.57])
         """
-        if not self.has_urdf or self._urdf_parser is None:
-            raise RuntimeError("URDF not loaded. Call load_urdf() first.")
-
-        limits = self._urdf_parser.get_joint_limits(joint_names)
-        pos_limits = [
-            [limit.lower, limit.upper]
-            for limit in limits.values()
-            if limit.lower is not None and limit.upper is not None
-        ]
-        return np.array(pos_limits)
+        # The parser memoizes and write-protects its arrays; copy so this
+        # public method keeps returning writable caller-owned arrays.
+        return self._require_urdf().get_joint_pos_limits_array(joint_names).copy()
 
     def get_joint_vel_limits(self, joint_names: list[str] | None = None) -> np.ndarray:
         """Get velocity limits for joints from URDF.
@@ -530,7 +602,8 @@ class RobotInfo:
 
         Returns:
             Numpy array of shape (N,) where N is number of joints.
-            Each element is the velocity limit for a joint.
+            Each element is the velocity limit for a joint. The array is
+            a fresh writable copy, safe to modify in place.
 
         Raises:
             RuntimeError: If URDF not loaded
@@ -543,14 +616,7 @@ class RobotInfo:
             >>> vel_limits[0]  # First joint velocity limit
             1.0
         """
-        if not self.has_urdf or self._urdf_parser is None:
-            raise RuntimeError("URDF not loaded. Call load_urdf() first.")
-
-        limits = self._urdf_parser.get_joint_limits(joint_names)
-        vel_limits = [
-            limit.velocity for limit in limits.values() if limit.velocity is not None
-        ]
-        return np.array(vel_limits)
+        return self._require_urdf().get_joint_vel_limits_array(joint_names).copy()
 
     def get_joint_effort_limits(
         self, joint_names: list[str] | None = None
@@ -563,7 +629,8 @@ class RobotInfo:
 
         Returns:
             Numpy array of shape (N,) where N is number of joints.
-            Each element is the effort limit for a joint.
+            Each element is the effort limit for a joint. The array is
+            a fresh writable copy, safe to modify in place.
 
         Raises:
             RuntimeError: If URDF not loaded
@@ -576,14 +643,7 @@ class RobotInfo:
             >>> effort_limits[0]  # First joint effort limit
             100.0
         """
-        if not self.has_urdf or self._urdf_parser is None:
-            raise RuntimeError("URDF not loaded. Call load_urdf() first.")
-
-        limits = self._urdf_parser.get_joint_limits(joint_names)
-        effort_limits = [
-            limit.effort for limit in limits.values() if limit.effort is not None
-        ]
-        return np.array(effort_limits)
+        return self._require_urdf().get_joint_effort_limits_array(joint_names).copy()
 
     def get_link_names(self) -> list[str]:
         """Get link names from URDF.
@@ -594,9 +654,7 @@ class RobotInfo:
         Raises:
             RuntimeError: If URDF not loaded
         """
-        if not self.has_urdf or self._urdf_parser is None:
-            raise RuntimeError("URDF not loaded. Call load_urdf() first.")
-        return self._urdf_parser.get_link_names()
+        return self._require_urdf().get_link_names()
 
     # =========================================================================
     # Utility Methods
@@ -1,12 +1,34 @@
 """URDF parsing utilities for extracting joint information."""
 
 import functools
-import xml.etree.ElementTree as ET
+import math
+import os
+from array import array
 from dataclasses import dataclass
 from pathlib import Path
+from typing import NamedTuple
 
+import numpy as np
 
-@dataclass
+# Prefer lxml's libxml2-backed parser when available (5-10x faster tree
+# construction on large URDFs); fall back to the stdlib ElementTree, which
+# still uses the C accelerator for parsing. Both expose the same subset of
+# the ElementTree API used below (parse/findall/get).
+try:
+    from lxml import etree as ET  # type: ignore[import-not-found]
+
+    # Precompiled selector: lxml evaluates it in C without re-parsing the
+    # expression string on each call.
+    _JOINT_XPATH = ET.XPath("./joint")
+except ImportError:
+    import xml.etree.ElementTree as ET  # type: ignore[no-redef]
+
+    # The stdlib ElementTree compiles and caches selector paths internally,
+    # so plain findall is the equivalent here.
+    _JOINT_XPATH = None
+
+
+@dataclass(slots=True, frozen=True)
 class JointLimit:
     """Joint limit information."""
 
@@ -23,7 +45,7 @@ class JointLimit:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JointInfo:
     """Complete joint information from URDF."""
 
@@ -42,6 +64,48 @@ class JointInfo:
         )
 
 
+@functools.lru_cache(maxsize=32)
+def _load_tree(urdf_path_str: str, mtime_ns: int, size: int):
+    """Parse an XML tree once per (path, mtime, size) triple.
+
+    Shared across URDFParser instances so that re-instantiating a parser
+    on an unchanged file skips the read and parse entirely. The cached
+    tree is read-only by convention; parsers only traverse it.
+    """
+    return ET.parse(urdf_path_str)
+
+
+def _float_or_none(value: str | None) -> float | None:
+    """Convert an optional attribute string to float, preserving None."""
+    return float(value) if value is not None else None
+
+
+class _ParsedModel(NamedTuple):
+    """Caches produced by one URDFParser._parse_all traversal.
+
+    Bundling them keeps every field non-optional once parsing has run,
+    so accessors can bind the caches they need without None checks.
+    """
+
+    joints: dict[str, JointInfo]
+    links: list[str]
+    tree: dict[str, list[str]]
+    by_type: dict[str, list[str]]
+    movable: list[str]
+    joint_name_set: frozenset[str]
+    # Canonical name -> JointLimit mapping; joints without a <limit>
+    # element are absent.
+    limits: dict[str, JointLimit]
+    # Structure-of-arrays view of the joint limits: row i of each array
+    # belongs to the joint mapped to i in limit_index. Missing
+    # effort/velocity values are stored as NaN.
+    limit_index: dict[str, int]
+    limits_lower: np.ndarray
+    limits_upper: np.ndarray
+    limits_effort: np.ndarray
+    limits_velocity: np.ndarray
+
+
 class URDFParser:
     """Parser for URDF files to extract robot joint information.
 
@@ -63,13 +127,97 @@ class URDFParser:
             FileNotFoundError: If URDF file does not exist.
             ET.ParseError: If URDF file is not valid XML.
         """
-        self.urdf_path = Path(urdf_path)
-        if not self.urdf_path.exists():
+        # Reuse a caller-supplied Path (load_urdf and the parser cache both
+        # pass one in). The stat below doubles as the existence check and
+        # keys the shared tree cache, so an unchanged file is parsed once
+        # across all parser instances.
+        self.urdf_path = urdf_path if isinstance(urdf_path, Path) else Path(urdf_path)
+        try:
+            st = os.stat(self.urdf_path)
+        except OSError:
             raise FileNotFoundError(f"URDF file not found: {urdf_path}")
 
-        self.tree = ET.parse(self.urdf_path)
+        self.tree = _load_tree(os.fspath(self.urdf_path), st.st_mtime_ns, st.st_size)
         self.root = self.tree.getroot()
-        self._joints_cache: dict[str, JointInfo] | None = None
+        # All per-file caches live in one _ParsedModel, filled on first use.
+        self._parsed: _ParsedModel | None = None
+        # Memoized limit-query results keyed by (kind, names tuple).
+        # Controllers tend to reissue the same joint subset every cycle;
+        # the cache turns those repeats into a single dict hit.
+        self._limit_query_cache: dict[tuple, object] = {}
+
+    def _ensure_parsed(self) -> _ParsedModel:
+        """Get the parsed caches, running the traversal on first call."""
+        parsed = self._parsed
+        if parsed is None:
+            parsed = self._parse_all()
+        return parsed
+
+    def _parse_all(self) -> _ParsedModel:
+        """Populate the joint, link, and joint-tree caches in one traversal.
+
+        The accessors used to walk the XML tree separately; a single pass
+        over the root's children fills all caches at once.
+
+        Returns:
+            The populated cache bundle, also stored on the instance.
+        """
+        joints: dict[str, JointInfo] = {}
+        links: list[str] = []
+        tree: dict[str, list[str]] = {}
+        by_type: dict[str, list[str]] = {}
+        movable: list[str] = []
+        is_movable = self._MOVABLE_JOINT_TYPES.__contains__
+
+        # Grow compact double arrays during the traversal and convert to
+        # NumPy once at the end, so limit queries become O(1) slicing.
+        limits_map: dict[str, JointLimit] = {}
+        limit_index: dict[str, int] = {}
+        lower = array("d")
+        upper = array("d")
+        effort = array("d")
+        velocity = array("d")
+
+        for element in self.root:
+            tag = element.tag
+            if tag == "joint":
+                joint_info = self._parse_joint(element)
+                joints[joint_info.name] = joint_info
+                tree.setdefault(joint_info.parent_link, []).append(joint_info.name)
+                by_type.setdefault(joint_info.joint_type, []).append(joint_info.name)
+                if is_movable(joint_info.joint_type):
+                    movable.append(joint_info.name)
+                limit = joint_info.limit
+                if limit is not None:
+                    limits_map[joint_info.name] = limit
+                    limit_index[joint_info.name] = len(lower)
+                    lower.append(limit.lower)
+                    upper.append(limit.upper)
+                    effort.append(
+                        limit.effort if limit.effort is not None else math.nan
+                    )
+                    velocity.append(
+                        limit.velocity if limit.velocity is not None else math.nan
+                    )
+            elif tag == "link":
+                links.append(element.get("name", ""))
+
+        parsed = _ParsedModel(
+            joints=joints,
+            links=links,
+            tree=tree,
+            by_type=by_type,
+            movable=movable,
+            joint_name_set=frozenset(joints),
+            limits=limits_map,
+            limit_index=limit_index,
+            limits_lower=np.asarray(lower),
+            limits_upper=np.asarray(upper),
+            limits_effort=np.asarray(effort),
+            limits_velocity=np.asarray(velocity),
+        )
+        self._parsed = parsed
+        return parsed
 
     def get_robot_name(self) -> str:
         """Get the robot name from URDF.
@@ -85,16 +233,7 @@ class URDFParser:
         Returns:
             Dictionary mapping joint names to JointInfo objects.
         """
-        if self._joints_cache is not None:
-            return self._joints_cache
-
-        joints = {}
-        for joint in self.root.findall("joint"):
-            joint_info = self._parse_joint(joint)
-            joints[joint_info.name] = joint_info
-
-        self._joints_cache = joints
-        return joints
+        return self._ensure_parsed().joints
 
     def _parse_joint(self, joint_element: ET.Element) -> JointInfo:
         """Parse a joint XML element into JointInfo.
@@ -114,17 +253,17 @@ class URDFParser:
         parent_link = parent.get("link", "") if parent is not None else ""
         child_link = child.get("link", "") if child is not None else ""
 
-        # Parse limit if exists
+        # Parse limit if exists. Read from .attrib (a plain dict) so each
+        # attribute costs one lookup instead of going through Element.get.
         limit_elem = joint_element.find("limit")
         limit = None
         if limit_elem is not None:
-            effort_str = limit_elem.get("effort")
-            velocity_str = limit_elem.get("velocity")
+            attrib = limit_elem.attrib
             limit = JointLimit(
-                lower=float(limit_elem.get("lower", "0")),
-                upper=float(limit_elem.get("upper", "0")),
-                effort=float(effort_str) if effort_str else None,
-                velocity=float(velocity_str) if velocity_str else None,
+                lower=float(attrib.get("lower", "0")),
+                upper=float(attrib.get("upper", "0")),
+                effort=_float_or_none(attrib.get("effort")),
+                velocity=_float_or_none(attrib.get("velocity")),
             )
 
         # Parse axis if exists
@@ -154,11 +293,28 @@ class URDFParser:
         Returns:
             List of joint names.
         """
-        joints = self.get_all_joints()
+        parsed = self._parsed
+        if parsed is None:
+            # Cold cache: read names straight off the XML without paying
+            # for full JointInfo construction (limit/axis float parsing).
+            elements = (
+                _JOINT_XPATH(self.root)
+                if _JOINT_XPATH is not None
+                else self.root.findall("joint")
+            )
+            if joint_type is None:
+                return [joint.get("name", "") for joint in elements]
+            return [
+                joint.get("name", "")
+                for joint in elements
+                if joint.get("type") == joint_type
+            ]
+
         if joint_type is None:
-            return list(joints.keys())
+            return list(parsed.joints.keys())
 
-        return [name for name, info in joints.items() if info.joint_type == joint_type]
+        # Copies so callers can't mutate the cached lists.
+        return list(parsed.by_type.get(joint_type, ()))
 
     def get_movable_joint_names(self) -> list[str]:
         """Get list of movable (non-fixed) joint names.
@@ -166,12 +322,35 @@ class URDFParser:
         Returns:
             List of movable joint names.
         """
-        joints = self.get_all_joints()
-        return [
-            name
-            for name, info in joints.items()
-            if info.joint_type in self._MOVABLE_JOINT_TYPES
-        ]
+        parsed = self._parsed
+        if parsed is None:
+            # Cold cache: same XML fast path as get_joint_names, with the
+            # membership test bound once for the per-joint loop.
+            is_movable = self._MOVABLE_JOINT_TYPES.__contains__
+            elements = (
+                _JOINT_XPATH(self.root)
+                if _JOINT_XPATH is not None
+                else self.root.findall("joint")
+            )
+            return [
+                joint.get("name", "")
+                for joint in elements
+                if is_movable(joint.get("type"))
+            ]
+
+        return list(parsed.movable)
+
+    def get_joint_name_set(self) -> frozenset[str]:
+        """Get all joint names as a frozenset for O(1) membership tests.
+
+        Use this instead of ``name in get_joint_names()`` when only
+        membership matters; it avoids the defensive list copy and the
+        linear scan.
+
+        Returns:
+            Frozenset of all joint names.
+        """
+        return self._ensure_parsed().joint_name_set
 
     def get_joint_limits(
         self,
@@ -186,17 +365,124 @@ class URDFParser:
             Dictionary mapping joint names to JointLimit objects.
             Joints without limits are excluded.
         """
-        joints = self.get_all_joints()
+        key = ("limits", tuple(joint_names) if joint_names is not None else None)
+        cached = self._limit_query_cache.get(key)
+        if cached is not None:
+            # Shallow copy: the result dict is caller-owned, so handing out
+            # the memoized object would let one caller's mutation poison
+            # every later query.
+            return dict(cached)  # type: ignore[arg-type]
+
+        all_limits = self._ensure_parsed().limits
 
         if joint_names is None:
-            joint_names = list(joints.keys())
+            limits = dict(all_limits)
+        else:
+            limits = {
+                name: all_limits[name] for name in joint_names if name in all_limits
+            }
+
+        self._remember_limit_query(key, limits)
+        return dict(limits)
 
-        limits = {}
-        for name in joint_names:
-            if name in joints and joints[name].limit is not None:
-                limits[name] = joints[name].limit
+    _LIMIT_QUERY_CACHE_SIZE = 16
 
-        return limits
+    def _remember_limit_query(self, key: tuple, value: object) -> None:
+        """Store a limit-query result, evicting the oldest entry when full."""
+        cache = self._limit_query_cache
+        if len(cache) >= self._LIMIT_QUERY_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
+
+    def _limit_rows(self, joint_names: list[str] | None) -> np.ndarray:
+        """Get the SoA row indices for the requested joints.
+
+        Args:
+            joint_names: List of joint names, or None for all joints with
+                limits. Names without limits are skipped.
+
+        Returns:
+            Index array into the limit arrays, in request order.
+        """
+        index = self._ensure_parsed().limit_index
+        if joint_names is None:
+            return np.arange(len(index), dtype=np.intp)
+        return np.fromiter(
+            (index[name] for name in joint_names if name in index),
+            dtype=np.intp,
+        )
+
+    def get_joint_pos_limits_array(
+        self,
+        joint_names: list[str] | None = None,
+    ) -> np.ndarray:
+        """Get position limits as an (N, 2) array of [lower, upper] rows.
+
+        Args:
+            joint_names: List of joint names. If None, returns limits for all
+                joints with limits. Joints without limits are excluded.
+
+        Returns:
+            Array of shape (N, 2) with lower and upper position limits.
+        """
+        key = ("pos", tuple(joint_names) if joint_names is not None else None)
+        arr = self._limit_query_cache.get(key)
+        if arr is None:
+            parsed = self._ensure_parsed()
+            idx = self._limit_rows(joint_names)
+            arr = np.stack((parsed.limits_lower[idx], parsed.limits_upper[idx]), axis=1)
+            # The cached array is shared between calls; write-protect it so a
+            # caller mutating the result fails loudly instead of poisoning
+            # later queries.
+            arr.setflags(write=False)
+            self._remember_limit_query(key, arr)
+        return arr  # type: ignore[return-value]
+
+    def get_joint_vel_limits_array(
+        self,
+        joint_names: list[str] | None = None,
+    ) -> np.ndarray:
+        """Get velocity limits as a 1-D array.
+
+        Args:
+            joint_names: List of joint names. If None, returns limits for all
+                joints with limits. Joints without a velocity limit are excluded.
+
+        Returns:
+            Array of velocity limits.
+        """
+        key = ("vel", tuple(joint_names) if joint_names is not None else None)
+        arr = self._limit_query_cache.get(key)
+        if arr is None:
+            values = self._ensure_parsed().limits_velocity[
+                self._limit_rows(joint_names)
+            ]
+            arr = values[~np.isnan(values)]
+            arr.setflags(write=False)
+            self._remember_limit_query(key, arr)
+        return arr  # type: ignore[return-value]
+
+    def get_joint_effort_limits_array(
+        self,
+        joint_names: list[str] | None = None,
+    ) -> np.ndarray:
+        """Get effort limits as a 1-D array.
+
+        Args:
+            joint_names: List of joint names. If None, returns limits for all
+                joints with limits. Joints without an effort limit are excluded.
+
+        Returns:
+            Array of effort limits.
+        """
+        key = ("effort", tuple(joint_names) if joint_names is not None else None)
+        arr = self._limit_query_cache.get(key)
+        if arr is None:
+            values = self._ensure_parsed().limits_effort[self._limit_rows(joint_names)]
+            arr = values[~np.isnan(values)]
+            arr.setflags(write=False)
+            self._remember_limit_query(key, arr)
+        return arr  # type: ignore[return-value]
 
     def get_joint_info(self, joint_name: str) -> JointInfo | None:
         """Get detailed information for a specific joint.
@@ -216,8 +502,7 @@ class URDFParser:
         Returns:
             List of link names.
         """
-        links = self.root.findall("link")
-        return [link.get("name", "") for link in links]
+        return list(self._ensure_parsed().links)
 
     def get_joint_tree(self) -> dict[str, list[str]]:
         """Get tree structure of joints organized by parent links.
@@ -225,28 +510,25 @@ class URDFParser:
         Returns:
             Dictionary mapping parent links to lists of child joints.
         """
-        joints = self.get_all_joints()
-        tree = {}
-
-        for joint_info in joints.values():
-            parent = joint_info.parent_link
-            if parent not in tree:
-                tree[parent] = []
-            tree[parent].append(joint_info.name)
-
-        return tree
+        tree = self._ensure_parsed().tree
+        # Copy the lists so callers can't mutate the cache.
+        return {parent: list(names) for parent, names in tree.items()}
 
 
 # Convenience functions for direct usage
 # Performance optimization: Cache URDFParser instances to avoid re-parsing
 
 
-@functools.lru_cache(maxsize=4)
-def _get_cached_parser(urdf_path_str: str) -> URDFParser:
-    """Get cached URDFParser for path. Cache up to 4 recent URDFs.
+@functools.lru_cache(maxsize=32)
+def _get_cached_parser_for_mtime(urdf_path_str: str, mtime_ns: int) -> URDFParser:
+    """Get cached URDFParser for a (path, mtime) pair. Cache up to 32 recent URDFs.
+
+    The modification time is part of the cache key so that an edited URDF is
+    re-parsed instead of silently returning a stale parser.
 
     Args:
-        urdf_path_str: String path to URDF file.
+        urdf_path_str: Resolved string path to URDF file.
+        mtime_ns: File modification time in nanoseconds (cache key only).
 
     Returns:
         Cached URDFParser instance.
@@ -254,10 +536,30 @@ def _get_cached_parser(urdf_path_str: str) -> URDFParser:
     return URDFParser(urdf_path_str)
 
 
+def _get_cached_parser(urdf_path: str | Path) -> URDFParser:
+    """Resolve a URDF path and return a cached parser for it.
+
+    Args:
+        urdf_path: Path to the URDF file.
+
+    Returns:
+        Cached URDFParser instance.
+
+    Raises:
+        FileNotFoundError: If URDF file does not exist.
+    """
+    resolved = os.path.realpath(urdf_path)
+    try:
+        mtime_ns = os.stat(resolved).st_mtime_ns
+    except OSError:
+        raise FileNotFoundError(f"URDF file not found: {urdf_path}")
+    return _get_cached_parser_for_mtime(resolved, mtime_ns)
+
+
 def parse_urdf(urdf_path: str | Path) -> URDFParser:
     """Parse a URDF file and return parser instance.
 
-    This function caches up to 4 recent URDF parsers for performance.
+    This function caches up to 32 recent URDF parsers for performance.
     Repeated calls with the same path will return the cached parser.
 
     Args:
@@ -266,7 +568,7 @@ def parse_urdf(urdf_path: str | Path) -> URDFParser:
     Returns:
         URDFParser instance (may be cached).
     """
-    return _get_cached_parser(str(urdf_path))
+    return _get_cached_parser(urdf_path)
 
 
 def get_joint_names(
@@ -284,7 +586,7 @@ def get_joint_names(
     Returns:
         List of joint names.
     """
-    parser = _get_cached_parser(str(urdf_path))
+    parser = _get_cached_parser(urdf_path)
     return parser.get_joint_names(joint_type)
 
 
@@ -299,7 +601,7 @@ def get_movable_joint_names(urdf_path: str | Path) -> list[str]:
     Returns:
         List of movable joint names.
     """
-    parser = _get_cached_parser(str(urdf_path))
+    parser = _get_cached_parser(urdf_path)
     return parser.get_movable_joint_names()
 
 
@@ -318,7 +620,7 @@ def get_joint_limits(
     Returns:
         Dictionary mapping joint names to JointLimit objects.
     """
-    parser = _get_cached_parser(str(urdf_path))
+    parser = _get_cached_parser(urdf_path)
     return parser.get_joint_limits(joint_names)
 
 
@@ -334,7 +636,7 @@ def get_joint_info(urdf_path: str | Path, joint_name: str) -> JointInfo | None:
     Returns:
         JointInfo object, or None if joint not found.
     """
-    parser = _get_cached_parser(str(urdf_path))
+    parser = _get_cached_parser(urdf_path)
     return parser.get_joint_info(joint_name)
 
 
@@ -349,5 +651,5 @@ def get_link_names(urdf_path: str | Path) -> list[str]:
     Returns:
         List of link names.
     """
-    parser = _get_cached_parser(str(urdf_path))
+    parser = _get_cached_parser(urdf_path)
     return parser.get_link_names()
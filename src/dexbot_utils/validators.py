@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import os
 
-if TYPE_CHECKING:
-    from .robot_info import RobotInfo
+from .constants import ROBOT_CONFIG_FILE_ENV_VAR, ROBOT_NAME_ENV_VAR
+from .robot_info import RobotInfo
 
 
 class ComponentValidationError(Exception):
@@ -14,6 +14,34 @@ class ComponentValidationError(Exception):
     pass
 
 
+# Shared env-resolved RobotInfo instances, keyed by the env values they were
+# built from. Validators only read component metadata, so sharing is safe;
+# a changed environment is a different key and gets a fresh instance.
+_default_robot_cache: dict[tuple[str | None, str | None], RobotInfo] = {}
+
+
+def _default_robot() -> RobotInfo:
+    """Get a shared RobotInfo resolved from the environment."""
+    key = (os.getenv(ROBOT_CONFIG_FILE_ENV_VAR), os.getenv(ROBOT_NAME_ENV_VAR))
+    robot = _default_robot_cache.get(key)
+    if robot is None:
+        robot = RobotInfo()
+        _default_robot_cache[key] = robot
+    return robot
+
+
+def _available_set(robot_config: RobotInfo) -> frozenset[str]:
+    """Get the robot's component names as a frozenset for O(1) membership.
+
+    RobotInfo snapshots its component keys at construction; reuse that
+    frozenset when present instead of rebuilding a list per validation.
+    """
+    cached = getattr(robot_config, "_component_key_set", None)
+    if cached is not None:
+        return cached
+    return frozenset(robot_config.get_component_list())
+
+
 def validate_component(
     component: str,
     robot_config: RobotInfo | None = None,
@@ -34,20 +62,16 @@ def validate_component(
     """
     # Get robot configuration
     if robot_config is None:
-        from .robot_info import RobotInfo
-
-        robot_config = RobotInfo()
-
-    components = robot_config.get_component_list()
-    robot_type = robot_config.robot_type
+        robot_config = _default_robot()
 
     # Check if component exists
-    has_component = component in components
+    has_component = component in _available_set(robot_config)
 
     if not has_component and raise_on_missing:
         raise ComponentValidationError(
-            f"Robot '{robot_type}' does not have component '{component}'. "
-            f"Available components: {components}"
+            f"Robot '{robot_config.robot_type}' does not have component "
+            f"'{component}'. "
+            f"Available components: {robot_config.get_component_list()}"
         )
 
     return has_component
@@ -73,23 +97,24 @@ def validate_components(
     """
     # Get robot configuration
     if robot_config is None:
-        from .robot_info import RobotInfo
+        robot_config = _default_robot()
 
-        robot_config = RobotInfo()
+    available = _available_set(robot_config)
 
-    available = robot_config.get_component_list()
-    robot_type = robot_config.robot_type
+    if not raise_on_missing:
+        # Short-circuits on the first miss with no throwaway list.
+        return all(comp in available for comp in components)
 
-    # Check all components
+    # Build the full missing list only on the error-reporting path.
     missing = [comp for comp in components if comp not in available]
 
-    if missing and raise_on_missing:
+    if missing:
         raise ComponentValidationError(
-            f"Robot '{robot_type}' is missing components: {missing}. "
-            f"Available components: {available}"
+            f"Robot '{robot_config.robot_type}' is missing components: {missing}. "
+            f"Available components: {robot_config.get_component_list()}"
         )
 
-    return len(missing) == 0
+    return True
 
 
 def require_component(component: str) -> None:
@@ -161,10 +186,14 @@ def has_any_component(
     Returns:
         True if robot has at least one component, False otherwise.
     """
-    for component in components:
-        if has_component(component, robot_config):
-            return True
-    return False
+    # Resolve the config once; otherwise each loop iteration would build
+    # a fresh RobotInfo from the environment.
+    if robot_config is None:
+        robot_config = _default_robot()
+
+    # One C-level set intersection (with internal short-circuit) instead of
+    # a Python loop over has_component calls.
+    return not _available_set(robot_config).isdisjoint(components)
 
 
 def get_missing_components(
@@ -182,13 +211,14 @@ def get_missing_components(
     """
     # Get robot configuration
     if robot_config is None:
-        from .robot_info import RobotInfo
-
-        robot_config = RobotInfo()
+        robot_config = _default_robot()
 
-    available = robot_config.get_component_list()
+    available = _available_set(robot_config)
 
-    # Check for missing components
-    missing = [comp for comp in required if comp not in available]
+    # Common case: nothing missing. One C-level superset check instead of
+    # a Python loop over the required names.
+    if available.issuperset(required):
+        return []
 
-    return missing
+    # Something is missing; build the list preserving request order.
+    return [comp for comp in required if comp not in available]
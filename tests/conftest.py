@@ -1,60 +1,49 @@
 """Pytest configuration and shared fixtures."""
 
-import os
 import tempfile
 from pathlib import Path
 from typing import Generator
 
 import pytest
 
+from dexbot_utils.urdf_utils import URDFParser
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_robot_name() -> str:
     """Return a mock robot name for testing."""
     return "dm/vgabcd123456-1"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_robot_name_vega_u() -> str:
     """Return a mock robot name for vega-1u (upper body) for testing."""
     return "dm/vgabcd123456-1u"
 
 
 @pytest.fixture
-def set_robot_env(mock_robot_name: str) -> Generator[str, None, None]:
+def set_robot_env(monkeypatch: pytest.MonkeyPatch, mock_robot_name: str) -> str:
     """Set ROBOT_NAME environment variable for testing."""
-    old_value = os.environ.get("ROBOT_NAME")
-    os.environ["ROBOT_NAME"] = mock_robot_name
-    yield mock_robot_name
-    if old_value is None:
-        os.environ.pop("ROBOT_NAME", None)
-    else:
-        os.environ["ROBOT_NAME"] = old_value
+    monkeypatch.setenv("ROBOT_NAME", mock_robot_name)
+    return mock_robot_name
 
 
 @pytest.fixture
-def set_robot_env_vega_u(mock_robot_name_vega_u: str) -> Generator[str, None, None]:
+def set_robot_env_vega_u(
+    monkeypatch: pytest.MonkeyPatch, mock_robot_name_vega_u: str
+) -> str:
     """Set ROBOT_NAME environment variable for vega-1u (upper body) testing."""
-    old_value = os.environ.get("ROBOT_NAME")
-    os.environ["ROBOT_NAME"] = mock_robot_name_vega_u
-    yield mock_robot_name_vega_u
-    if old_value is None:
-        os.environ.pop("ROBOT_NAME", None)
-    else:
-        os.environ["ROBOT_NAME"] = old_value
+    monkeypatch.setenv("ROBOT_NAME", mock_robot_name_vega_u)
+    return mock_robot_name_vega_u
 
 
 @pytest.fixture
-def unset_robot_env() -> Generator[None, None, None]:
+def unset_robot_env(monkeypatch: pytest.MonkeyPatch) -> None:
     """Ensure ROBOT_NAME environment variable is not set."""
-    old_value = os.environ.get("ROBOT_NAME")
-    os.environ.pop("ROBOT_NAME", None)
-    yield
-    if old_value is not None:
-        os.environ["ROBOT_NAME"] = old_value
+    monkeypatch.delenv("ROBOT_NAME", raising=False)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_urdf() -> str:
     """Return sample URDF content for testing."""
     return """<?xml version="1.0"?>
@@ -125,8 +114,18 @@ def sample_urdf() -> str:
 
 
 @pytest.fixture
+def vega1_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point ROBOT_CONFIG at vega_1 for validators resolving from env."""
+    monkeypatch.setenv("ROBOT_CONFIG", "vega_1")
+
+
+@pytest.fixture(scope="session")
 def sample_urdf_file(sample_urdf: str) -> Generator[Path, None, None]:
-    """Create a temporary URDF file for testing."""
+    """Create a temporary URDF file for testing.
+
+    Session-scoped: tests only read the file, so one copy serves the
+    whole run.
+    """
     with tempfile.NamedTemporaryFile(mode="w", suffix=".urdf", delete=False) as f:
         f.write(sample_urdf)
         temp_path = Path(f.name)
@@ -136,3 +135,9 @@ def sample_urdf_file(sample_urdf: str) -> Generator[Path, None, None]:
     # Cleanup
     if temp_path.exists():
         temp_path.unlink()
+
+
+@pytest.fixture(scope="session")
+def sample_parser(sample_urdf_file: Path) -> URDFParser:
+    """A shared URDFParser over the sample URDF for read-only tests."""
+    return URDFParser(sample_urdf_file)
@@ -1,5 +1,7 @@
 """Tests for runtime_override_robot_config hand auto-detection."""
 
+import pytest
+
 from dexbot_utils.cfg_modifier import runtime_override_robot_config
 from dexbot_utils.configs.components.vega_1.hand import (
     DexDGripperConfig,
@@ -16,6 +18,16 @@ def _make_config(components: dict) -> BaseRobotConfig:
     return BaseRobotConfig(components=components)
 
 
+@pytest.fixture
+def empty_config() -> BaseRobotConfig:
+    """A component-less config for the injection/no-op cases.
+
+    Function-scoped on purpose: runtime_override_robot_config mutates the
+    config in place, so sharing one instance would couple the tests.
+    """
+    return BaseRobotConfig(components={})
+
+
 # -------------------------------------------------------------------
 # Case: hand NOT in config + known type detected → inject
 # -------------------------------------------------------------------
@@ -24,16 +36,16 @@ def _make_config(components: dict) -> BaseRobotConfig:
 class TestAutoAddHand:
     """Test injecting hand config when detected but missing from config."""
 
-    def test_adds_gripper_when_detected_but_missing(self):
-        config = _make_config({})
+    def test_adds_gripper_when_detected_but_missing(self, empty_config):
+        config = empty_config
         runtime_override_robot_config(config, hand_types={"left": HandType.DexGripper})
         assert "left_hand" in config.components
         assert isinstance(config.components["left_hand"], DexDGripperConfig)
         assert config.components["left_hand"].side == "left"
         assert config.components["left_hand"].enabled is True
 
-    def test_adds_f5d6_v2_when_detected_but_missing(self):
-        config = _make_config({})
+    def test_adds_f5d6_v2_when_detected_but_missing(self, empty_config):
+        config = empty_config
         runtime_override_robot_config(
             config, hand_types={"right": HandType.HandF5D6_V2}
         )
@@ -41,14 +53,14 @@ class TestAutoAddHand:
         assert isinstance(config.components["right_hand"], F5D6HandV2Config)
         assert config.components["right_hand"].side == "right"
 
-    def test_adds_f5d6_v1_when_detected_but_missing(self):
-        config = _make_config({})
+    def test_adds_f5d6_v1_when_detected_but_missing(self, empty_config):
+        config = empty_config
         runtime_override_robot_config(config, hand_types={"left": HandType.HandF5D6_V1})
         assert "left_hand" in config.components
         assert isinstance(config.components["left_hand"], F5D6HandV1Config)
 
-    def test_adds_both_hands_when_both_detected(self):
-        config = _make_config({})
+    def test_adds_both_hands_when_both_detected(self, empty_config):
+        config = empty_config
         runtime_override_robot_config(
             config,
             hand_types={
@@ -61,8 +73,8 @@ class TestAutoAddHand:
         assert isinstance(config.components["left_hand"], DexDGripperConfig)
         assert isinstance(config.components["right_hand"], F5D6HandV2Config)
 
-    def test_does_not_add_when_unknown_and_missing(self):
-        config = _make_config({})
+    def test_does_not_add_when_unknown_and_missing(self, empty_config):
+        config = empty_config
         runtime_override_robot_config(config, hand_types={"left": HandType.UNKNOWN})
         assert "left_hand" not in config.components
 
@@ -158,9 +170,9 @@ class TestDisableEstopChecking:
         assert config.components["estop"].enabled is True
         assert config.components["estop"].monitoring is False
 
-    def test_disable_estop_noop_when_no_estop(self):
+    def test_disable_estop_noop_when_no_estop(self, empty_config):
         """When estop not in config, disable_estop_checking is a no-op."""
-        config = _make_config({})
+        config = empty_config
         runtime_override_robot_config(
             config, hand_types={}, disable_estop_checking=True
         )
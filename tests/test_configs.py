@@ -0,0 +1,66 @@
+"""Tests for robot configuration classes and the registry."""
+
+import pytest
+
+from dexbot_utils.configs.registry import ConfigRegistry
+from dexbot_utils.configs.robots.base import BaseRobotConfig
+
+
+@pytest.fixture
+def vega1_config() -> BaseRobotConfig:
+    """A fresh, mutable vega_1 config for sensor-enabling tests."""
+    return ConfigRegistry.get("vega_1")
+
+
+class TestEnableSensors:
+    """Tests for BaseRobotConfig.enable_sensors."""
+
+    def test_enable_multiple_sensors(self, vega1_config: BaseRobotConfig):
+        """Test that every named sensor ends up enabled."""
+        names = ["head_imu", "ultrasonic"]
+        for name in names:
+            assert not vega1_config.sensors[name].enabled
+        vega1_config.enable_sensors(names)
+        for name in names:
+            assert vega1_config.sensors[name].enabled
+
+    def test_unknown_sensor_raises(self, vega1_config: BaseRobotConfig):
+        """Test that a batch with unknown names raises listing them."""
+        with pytest.raises(KeyError, match="nonexistent"):
+            vega1_config.enable_sensors(["head_imu", "nonexistent"])
+
+    def test_bad_batch_enables_nothing(self, vega1_config: BaseRobotConfig):
+        """Test that validation runs before any sensor is touched."""
+        with pytest.raises(KeyError):
+            vega1_config.enable_sensors(["head_imu", "nonexistent"])
+        assert not vega1_config.sensors["head_imu"].enabled
+
+    def test_empty_batch_is_noop(self, vega1_config: BaseRobotConfig):
+        """Test that an empty batch neither raises nor enables anything."""
+        vega1_config.enable_sensors([])
+        assert not any(s.enabled for s in vega1_config.sensors.values())
+
+
+class TestGetShared:
+    """Tests for ConfigRegistry.get_shared."""
+
+    def test_get_shared_returns_same_instance(self):
+        """Test that repeated lookups return the one shared instance."""
+        first = ConfigRegistry.get_shared("vega_1")
+        second = ConfigRegistry.get_shared("vega_1")
+
+        assert first is second
+        assert first.robot_model == "vega_1"
+
+    def test_get_shared_unknown_variant(self):
+        """Test that an unknown variant raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown robot variant"):
+            ConfigRegistry.get_shared("nonexistent_robot")
+
+    def test_get_returns_copy_of_shared(self):
+        """Test that get() copies are independent of the shared instance."""
+        shared = ConfigRegistry.get_shared("vega_1")
+        copy = ConfigRegistry.get("vega_1")
+
+        assert copy is not shared
+        assert copy.robot_model == shared.robot_model
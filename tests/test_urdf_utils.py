@@ -1,6 +1,5 @@
 """Tests for urdf_utils module."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -31,16 +30,14 @@ class TestURDFParser:
         with pytest.raises(FileNotFoundError):
             URDFParser("/path/to/nonexistent.urdf")
 
-    def test_get_robot_name(self, sample_urdf_file: Path):
+    def test_get_robot_name(self, sample_parser: URDFParser):
         """Test getting robot name from URDF."""
-        parser = URDFParser(sample_urdf_file)
-        name = parser.get_robot_name()
+        name = sample_parser.get_robot_name()
         assert name == "test_robot"
 
-    def test_get_all_joints(self, sample_urdf_file: Path):
+    def test_get_all_joints(self, sample_parser: URDFParser):
         """Test getting all joints from URDF."""
-        parser = URDFParser(sample_urdf_file)
-        joints = parser.get_all_joints()
+        joints = sample_parser.get_all_joints()
 
         assert len(joints) == 4  # joint1, joint2, joint3, fixed_joint
         assert "joint1" in joints
@@ -49,13 +46,12 @@ class TestURDFParser:
         assert "fixed_joint" in joints
 
         # Test caching
-        joints2 = parser.get_all_joints()
+        joints2 = sample_parser.get_all_joints()
         assert joints is joints2  # Same object
 
-    def test_joint_info_details(self, sample_urdf_file: Path):
+    def test_joint_info_details(self, sample_parser: URDFParser):
         """Test detailed joint information."""
-        parser = URDFParser(sample_urdf_file)
-        joint1 = parser.get_joint_info("joint1")
+        joint1 = sample_parser.get_joint_info("joint1")
 
         assert joint1 is not None
         assert joint1.name == "joint1"
@@ -65,27 +61,24 @@ class TestURDFParser:
         assert joint1.limit is not None
         assert joint1.axis is not None
 
-    def test_joint_limit_details(self, sample_urdf_file: Path):
+    def test_joint_limit_details(self, sample_parser: URDFParser):
         """Test joint limit information."""
-        parser = URDFParser(sample_urdf_file)
-        joint1 = parser.get_joint_info("joint1")
+        joint1 = sample_parser.get_joint_info("joint1")
 
         assert joint1.limit.lower == -1.57
         assert joint1.limit.upper == 1.57
         assert joint1.limit.effort == 100.0
         assert joint1.limit.velocity == 1.0
 
-    def test_joint_axis(self, sample_urdf_file: Path):
+    def test_joint_axis(self, sample_parser: URDFParser):
         """Test joint axis information."""
-        parser = URDFParser(sample_urdf_file)
-        joint1 = parser.get_joint_info("joint1")
+        joint1 = sample_parser.get_joint_info("joint1")
 
         assert joint1.axis == (0.0, 0.0, 1.0)
 
-    def test_get_joint_names_all(self, sample_urdf_file: Path):
+    def test_get_joint_names_all(self, sample_parser: URDFParser):
         """Test getting all joint names."""
-        parser = URDFParser(sample_urdf_file)
-        names = parser.get_joint_names()
+        names = sample_parser.get_joint_names()
 
         assert len(names) == 4
         assert "joint1" in names
@@ -93,27 +86,24 @@ class TestURDFParser:
         assert "joint3" in names
         assert "fixed_joint" in names
 
-    def test_get_joint_names_filtered(self, sample_urdf_file: Path):
+    def test_get_joint_names_filtered(self, sample_parser: URDFParser):
         """Test getting joint names filtered by type."""
-        parser = URDFParser(sample_urdf_file)
-
-        revolute = parser.get_joint_names(joint_type="revolute")
+        revolute = sample_parser.get_joint_names(joint_type="revolute")
         assert len(revolute) == 2
         assert "joint1" in revolute
         assert "joint2" in revolute
 
-        prismatic = parser.get_joint_names(joint_type="prismatic")
+        prismatic = sample_parser.get_joint_names(joint_type="prismatic")
         assert len(prismatic) == 1
         assert "joint3" in prismatic
 
-        fixed = parser.get_joint_names(joint_type="fixed")
+        fixed = sample_parser.get_joint_names(joint_type="fixed")
         assert len(fixed) == 1
         assert "fixed_joint" in fixed
 
-    def test_get_movable_joint_names(self, sample_urdf_file: Path):
+    def test_get_movable_joint_names(self, sample_parser: URDFParser):
         """Test getting only movable joint names."""
-        parser = URDFParser(sample_urdf_file)
-        movable = parser.get_movable_joint_names()
+        movable = sample_parser.get_movable_joint_names()
 
         assert len(movable) == 3  # joint1, joint2, joint3 (not fixed_joint)
         assert "joint1" in movable
@@ -121,10 +111,9 @@ class TestURDFParser:
         assert "joint3" in movable
         assert "fixed_joint" not in movable
 
-    def test_get_joint_limits_all(self, sample_urdf_file: Path):
+    def test_get_joint_limits_all(self, sample_parser: URDFParser):
         """Test getting all joint limits."""
-        parser = URDFParser(sample_urdf_file)
-        limits = parser.get_joint_limits()
+        limits = sample_parser.get_joint_limits()
 
         assert len(limits) == 3  # fixed_joint has no limits
         assert "joint1" in limits
@@ -134,26 +123,23 @@ class TestURDFParser:
         assert limits["joint1"].lower == -1.57
         assert limits["joint1"].upper == 1.57
 
-    def test_get_joint_limits_specific(self, sample_urdf_file: Path):
+    def test_get_joint_limits_specific(self, sample_parser: URDFParser):
         """Test getting limits for specific joints."""
-        parser = URDFParser(sample_urdf_file)
-        limits = parser.get_joint_limits(joint_names=["joint1", "joint3"])
+        limits = sample_parser.get_joint_limits(joint_names=["joint1", "joint3"])
 
         assert len(limits) == 2
         assert "joint1" in limits
         assert "joint3" in limits
         assert "joint2" not in limits
 
-    def test_get_joint_info_missing(self, sample_urdf_file: Path):
+    def test_get_joint_info_missing(self, sample_parser: URDFParser):
         """Test getting info for non-existent joint."""
-        parser = URDFParser(sample_urdf_file)
-        info = parser.get_joint_info("nonexistent_joint")
+        info = sample_parser.get_joint_info("nonexistent_joint")
         assert info is None
 
-    def test_get_link_names(self, sample_urdf_file: Path):
+    def test_get_link_names(self, sample_parser: URDFParser):
         """Test getting all link names."""
-        parser = URDFParser(sample_urdf_file)
-        links = parser.get_link_names()
+        links = sample_parser.get_link_names()
 
         assert len(links) == 4
         assert "base_link" in links
@@ -161,10 +147,16 @@ class TestURDFParser:
         assert "link2" in links
         assert "end_effector" in links
 
-    def test_get_joint_tree(self, sample_urdf_file: Path):
+    def test_get_joint_name_set(self, sample_parser: URDFParser):
+        """Test getting joint names as a frozenset."""
+        names = sample_parser.get_joint_name_set()
+
+        assert isinstance(names, frozenset)
+        assert names == {"joint1", "joint2", "joint3", "fixed_joint"}
+
+    def test_get_joint_tree(self, sample_parser: URDFParser):
         """Test getting joint tree structure."""
-        parser = URDFParser(sample_urdf_file)
-        tree = parser.get_joint_tree()
+        tree = sample_parser.get_joint_tree()
 
         assert "base_link" in tree
         assert "joint1" in tree["base_link"]
@@ -337,30 +329,22 @@ class TestConvenienceFunctions:
 class TestInvalidURDF:
     """Tests for handling invalid URDF files."""
 
-    def test_invalid_xml(self):
+    def test_invalid_xml(self, tmp_path: Path):
         """Test parsing invalid XML."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".urdf", delete=False) as f:
-            f.write("This is not valid XML")
-            temp_path = Path(f.name)
+        urdf_path = tmp_path / "invalid.urdf"
+        urdf_path.write_text("This is not valid XML")
 
-        try:
-            with pytest.raises(Exception):  # Will raise ET.ParseError
-                URDFParser(temp_path)
-        finally:
-            temp_path.unlink()
+        with pytest.raises(Exception):  # Will raise ET.ParseError
+            URDFParser(urdf_path)
 
-    def test_empty_urdf(self):
+    def test_empty_urdf(self, tmp_path: Path):
         """Test parsing empty URDF."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".urdf", delete=False) as f:
-            f.write('<?xml version="1.0"?><robot name="empty"></robot>')
-            temp_path = Path(f.name)
-
-        try:
-            parser = URDFParser(temp_path)
-            joints = parser.get_all_joints()
-            assert len(joints) == 0
-
-            links = parser.get_link_names()
-            assert len(links) == 0
-        finally:
-            temp_path.unlink()
+        urdf_path = tmp_path / "empty.urdf"
+        urdf_path.write_text('<?xml version="1.0"?><robot name="empty"></robot>')
+
+        parser = URDFParser(urdf_path)
+        joints = parser.get_all_joints()
+        assert len(joints) == 0
+
+        links = parser.get_link_names()
+        assert len(links) == 0
@@ -1,7 +1,5 @@
 """Tests for validators module."""
 
-import os
-
 import pytest
 
 from dexbot_utils import RobotInfo
@@ -18,247 +16,107 @@ from dexbot_utils.validators import (
 )
 
 
-class TestValidateComponent:
-    """Tests for validate_component function."""
-
-    def test_validate_component_exists(self):
-        """Test validating existing component."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            result = validate_component("left_arm")
-            assert result is True
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-    def test_validate_component_missing_raises(self):
+@pytest.fixture(scope="module")
+def vega1_robot() -> RobotInfo:
+    """A shared vega_1 RobotInfo for read-only validator checks."""
+    return RobotInfo("vega_1")
+
+
+# (validator, args, kwargs, expected) cases for the non-raising paths.
+BOOL_CASES = [
+    (validate_component, ("left_arm",), {}, True),
+    (validate_component, ("nonexistent",), {"raise_on_missing": False}, False),
+    (validate_components, (["left_arm", "right_arm", "torso"],), {}, True),
+    (
+        validate_components,
+        (["left_arm", "nonexistent"],),
+        {"raise_on_missing": False},
+        False,
+    ),
+    (has_component, ("left_arm",), {}, True),
+    (has_component, ("nonexistent",), {}, False),
+    (has_all_components, (["left_arm", "right_arm", "torso"],), {}, True),
+    (has_all_components, (["left_arm", "nonexistent"],), {}, False),
+    (has_any_component, (["left_arm", "right_arm"],), {}, True),
+    (has_any_component, (["left_arm", "nonexistent"],), {}, True),
+    (has_any_component, (["nonexistent1", "nonexistent2"],), {}, False),
+]
+
+BOOL_CASE_IDS = [
+    f"{fn.__name__}-{'+'.join(args[0]) if isinstance(args[0], list) else args[0]}"
+    for fn, args, kwargs, expected in BOOL_CASES
+]
+
+
+class TestValidatorResults:
+    """Boolean validator results, with explicit config and from env."""
+
+    @pytest.mark.parametrize("fn,args,kwargs,expected", BOOL_CASES, ids=BOOL_CASE_IDS)
+    def test_with_explicit_config(self, vega1_robot, fn, args, kwargs, expected):
+        """Test validators with an explicit RobotInfo."""
+        assert fn(*args, robot_config=vega1_robot, **kwargs) is expected
+
+    @pytest.mark.parametrize("fn,args,kwargs,expected", BOOL_CASES, ids=BOOL_CASE_IDS)
+    def test_from_environment(self, vega1_env, fn, args, kwargs, expected):
+        """Test validators resolving the config from ROBOT_CONFIG."""
+        assert fn(*args, **kwargs) is expected
+
+
+class TestValidatorRaises:
+    """Exception-raising validator paths."""
+
+    def test_validate_component_missing_raises(self, vega1_env):
         """Test validation raises for missing component."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            with pytest.raises(
-                ComponentValidationError, match="does not have component"
-            ):
-                validate_component("nonexistent_component")
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-    def test_validate_component_missing_no_raise(self):
-        """Test validation returns False without raising."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            result = validate_component("nonexistent_component", raise_on_missing=False)
-            assert result is False
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-    def test_validate_component_with_robot_config(self):
-        """Test validation with explicit RobotInfo."""
-        robot = RobotInfo("vega_1")
-        result = validate_component("left_arm", robot_config=robot)
-        assert result is True
-
-
-class TestValidateComponents:
-    """Tests for validate_components function."""
+        with pytest.raises(ComponentValidationError, match="does not have component"):
+            validate_component("nonexistent_component")
 
-    def test_validate_components_all_exist(self):
-        """Test validating multiple existing components."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            result = validate_components(["left_arm", "right_arm", "torso"])
-            assert result is True
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-    def test_validate_components_some_missing_raises(self):
+    def test_validate_components_some_missing_raises(self, vega1_env):
         """Test validation raises when some components missing."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            with pytest.raises(ComponentValidationError, match="missing components"):
-                validate_components(["left_arm", "nonexistent1", "nonexistent2"])
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-    def test_validate_components_some_missing_no_raise(self):
-        """Test validation returns False without raising."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            result = validate_components(
-                ["left_arm", "nonexistent"], raise_on_missing=False
-            )
-            assert result is False
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-    def test_validate_components_with_robot_config(self):
-        """Test validation with explicit RobotInfo."""
-        robot = RobotInfo("vega_1")
-        result = validate_components(["left_arm", "right_arm"], robot_config=robot)
-        assert result is True
+        with pytest.raises(ComponentValidationError, match="missing components"):
+            validate_components(["left_arm", "nonexistent1", "nonexistent2"])
 
 
 class TestRequireComponent:
-    """Tests for require_component function."""
+    """Tests for require_component / require_components."""
 
-    def test_require_component_exists(self):
+    def test_require_component_exists(self, vega1_env):
         """Test requiring existing component."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            # Should not raise
-            require_component("left_arm")
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
+        # Should not raise
+        require_component("left_arm")
 
-    def test_require_component_missing(self):
+    def test_require_component_missing(self, vega1_env):
         """Test requiring missing component raises."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            with pytest.raises(ComponentValidationError):
-                require_component("nonexistent_component")
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
+        with pytest.raises(ComponentValidationError):
+            require_component("nonexistent_component")
 
-class TestRequireComponents:
-    """Tests for require_components function."""
-
-    def test_require_components_all_exist(self):
+    def test_require_components_all_exist(self, vega1_env):
         """Test requiring multiple existing components."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            # Should not raise
-            require_components(["left_arm", "right_arm", "torso"])
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
+        # Should not raise
+        require_components(["left_arm", "right_arm", "torso"])
 
-    def test_require_components_some_missing(self):
+    def test_require_components_some_missing(self, vega1_env):
         """Test requiring components with some missing raises."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            with pytest.raises(ComponentValidationError):
-                require_components(["left_arm", "nonexistent"])
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-
-class TestHasComponent:
-    """Tests for has_component function."""
+        with pytest.raises(ComponentValidationError):
+            require_components(["left_arm", "nonexistent"])
 
-    def test_has_component_true(self):
-        """Test has_component returns True for existing component."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            assert has_component("left_arm") is True
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
 
-    def test_has_component_false(self):
-        """Test has_component returns False for missing component."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            assert has_component("nonexistent") is False
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-    def test_has_component_with_config(self):
-        """Test has_component with explicit config."""
-        robot = RobotInfo("vega_1")
-        assert has_component("left_arm", robot_config=robot) is True
-
-
-class TestHasAllComponents:
-    """Tests for has_all_components function."""
-
-    def test_has_all_components_true(self):
-        """Test has_all_components returns True when all present."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            assert has_all_components(["left_arm", "right_arm", "torso"]) is True
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-    def test_has_all_components_false(self):
-        """Test has_all_components returns False when some missing."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            assert has_all_components(["left_arm", "nonexistent"]) is False
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-    def test_has_all_components_with_config(self):
-        """Test has_all_components with explicit config."""
-        robot = RobotInfo("vega_1")
-        assert has_all_components(["left_arm", "right_arm"], robot_config=robot) is True
-
-
-class TestHasAnyComponent:
-    """Tests for has_any_component function."""
-
-    def test_has_any_component_all_present(self):
-        """Test has_any_component returns True when all present."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            assert has_any_component(["left_arm", "right_arm"]) is True
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-    def test_has_any_component_some_present(self):
-        """Test has_any_component returns True when some present."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            assert has_any_component(["left_arm", "nonexistent"]) is True
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-    def test_has_any_component_none_present(self):
-        """Test has_any_component returns False when none present."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            assert has_any_component(["nonexistent1", "nonexistent2"]) is False
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-    def test_has_any_component_with_config(self):
-        """Test has_any_component with explicit config."""
-        robot = RobotInfo("vega_1")
-        assert has_any_component(["left_arm"], robot_config=robot) is True
+# (required, expected missing) cases for get_missing_components.
+MISSING_CASES = [
+    (["left_arm", "right_arm", "torso"], []),
+    (["left_arm", "nonexistent1", "nonexistent2"], ["nonexistent1", "nonexistent2"]),
+    (["nonexistent1", "nonexistent2"], ["nonexistent1", "nonexistent2"]),
+]
 
 
 class TestGetMissingComponents:
     """Tests for get_missing_components function."""
 
-    def test_get_missing_components_none_missing(self):
-        """Test get_missing_components returns empty list when all present."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            missing = get_missing_components(["left_arm", "right_arm", "torso"])
-            assert missing == []
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-    def test_get_missing_components_some_missing(self):
-        """Test get_missing_components returns missing components."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            missing = get_missing_components(
-                ["left_arm", "nonexistent1", "nonexistent2"]
-            )
-            assert set(missing) == {"nonexistent1", "nonexistent2"}
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
-
-    def test_get_missing_components_all_missing(self):
-        """Test get_missing_components when all missing."""
-        os.environ["ROBOT_CONFIG"] = "vega_1"
-        try:
-            missing = get_missing_components(["nonexistent1", "nonexistent2"])
-            assert set(missing) == {"nonexistent1", "nonexistent2"}
-        finally:
-            os.environ.pop("ROBOT_CONFIG", None)
+    @pytest.mark.parametrize("required,expected", MISSING_CASES)
+    def test_with_explicit_config(self, vega1_robot, required, expected):
+        """Test get_missing_components with an explicit RobotInfo."""
+        assert get_missing_components(required, robot_config=vega1_robot) == expected
 
-    def test_get_missing_components_with_config(self):
-        """Test get_missing_components with explicit config."""
-        robot = RobotInfo("vega_1")
-        missing = get_missing_components(
-            ["left_arm", "nonexistent"], robot_config=robot
-        )
-        assert missing == ["nonexistent"]
+    @pytest.mark.parametrize("required,expected", MISSING_CASES)
+    def test_from_environment(self, vega1_env, required, expected):
+        """Test get_missing_components resolving the config from env."""
+        assert get_missing_components(required) == expected